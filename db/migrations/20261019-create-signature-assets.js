@@ -0,0 +1,78 @@
+// migrations/20261019-create-signature-assets.js
+const { defaultCreate } = require('../migrationLib/createHelper.cjs');
+
+/** @type {import('sequelize-cli').Migration} */
+module.exports = {
+  async up(queryInterface, Sequelize) {
+    const tableOpts = { charset: 'utf8mb4', collate: 'utf8mb4_unicode_ci' };
+
+    // 정규화된 서명 이미지 (콘텐츠 해시 기준 1건만 저장)
+    await queryInterface.createTable(
+      'signatureAssets',
+      {
+        // 공통 컬럼(id, createdAt, updatedAt)
+        ...defaultCreate,
+
+        // 정규화된 PNG 바이트의 SHA-256 (hex)
+        contentHash: {
+          type: Sequelize.STRING(64),
+          allowNull: false,
+        },
+
+        mimeType: {
+          type: Sequelize.STRING(30),
+          allowNull: false,
+          defaultValue: 'image/png',
+        },
+
+        width: {
+          type: Sequelize.INTEGER,
+          allowNull: false,
+        },
+
+        height: {
+          type: Sequelize.INTEGER,
+          allowNull: false,
+        },
+
+        byteSize: {
+          type: Sequelize.INTEGER,
+          allowNull: false,
+        },
+
+        // LONGBLOB
+        data: {
+          type: Sequelize.BLOB('long'),
+          allowNull: false,
+        },
+      },
+      tableOpts
+    );
+
+    await queryInterface.addIndex('signatureAssets', ['contentHash'], {
+      name: 'ux_signatureAssets_contentHash',
+      unique: true,
+    });
+
+    // 추천서/사용자 서명은 blob 대신 해시로 참조
+    await queryInterface.addColumn('recommendation', 'signatureHash', {
+      type: Sequelize.STRING(64),
+      allowNull: true,
+    });
+    await queryInterface.addIndex('recommendation', ['signatureHash'], {
+      name: 'ix_recommendation_signatureHash',
+    });
+
+    await queryInterface.addColumn('userSignatures', 'signatureHash', {
+      type: Sequelize.STRING(64),
+      allowNull: true,
+    });
+  },
+
+  async down(queryInterface) {
+    await queryInterface.removeColumn('userSignatures', 'signatureHash');
+    await queryInterface.removeIndex('recommendation', 'ix_recommendation_signatureHash');
+    await queryInterface.removeColumn('recommendation', 'signatureHash');
+    await queryInterface.dropTable('signatureAssets');
+  },
+};
@@ -0,0 +1,192 @@
+// migrations/20261020-signature-assets-refcount-backfill.js
+// signatureAssets 참조 카운트 추가 + 기존 추천서/사용자 서명의 blob을 해시 참조로 이전
+const crypto = require('crypto');
+
+const IMAGE_SIGNATURE_TYPES = ['draw', 'image', 'upload'];
+const BATCH_SIZE = 200;
+
+// data:image/png;base64,... → { mimeType, buffer }
+function decodeDataUrl(data) {
+  let mimeType = 'image/png';
+  let payload = data;
+  const comma = data.indexOf(',');
+  if (comma >= 0) {
+    const match = /^data:([^;,]+)/.exec(data.slice(0, comma));
+    if (match) mimeType = match[1];
+    payload = data.slice(comma + 1);
+  }
+  return { mimeType, buffer: Buffer.from(payload, 'base64') };
+}
+
+// PNG면 IHDR에서 크기 추출, 그 외는 null
+function pngSize(buffer) {
+  if (buffer.length >= 24 && buffer.readUInt32BE(0) === 0x89504e47) {
+    return { width: buffer.readUInt32BE(16), height: buffer.readUInt32BE(20) };
+  }
+  return { width: null, height: null };
+}
+
+async function ensureAsset(queryInterface, transaction, seen, data) {
+  const { mimeType, buffer } = decodeDataUrl(data);
+  const contentHash = crypto.createHash('sha256').update(buffer).digest('hex');
+  if (seen.has(contentHash)) return contentHash;
+
+  const [existing] = await queryInterface.sequelize.query(
+    'SELECT id FROM signatureAssets WHERE contentHash = :contentHash',
+    { replacements: { contentHash }, type: queryInterface.sequelize.QueryTypes.SELECT, transaction }
+  );
+  if (!existing) {
+    const { width, height } = pngSize(buffer);
+    await queryInterface.bulkInsert(
+      'signatureAssets',
+      [{
+        contentHash,
+        mimeType,
+        width,
+        height,
+        byteSize: buffer.length,
+        data: buffer,
+        refCount: 0,
+        createdAt: new Date(),
+        updatedAt: new Date(),
+      }],
+      { transaction }
+    );
+  }
+  seen.add(contentHash);
+  return contentHash;
+}
+
+/** @type {import('sequelize-cli').Migration} */
+module.exports = {
+  async up(queryInterface, Sequelize) {
+    await queryInterface.addColumn('signatureAssets', 'refCount', {
+      type: Sequelize.INTEGER,
+      allowNull: false,
+      defaultValue: 0,
+    });
+    // 백필된 레거시 이미지(JPEG 등)는 크기를 알 수 없으므로 null 허용
+    await queryInterface.changeColumn('signatureAssets', 'width', {
+      type: Sequelize.INTEGER,
+      allowNull: true,
+    });
+    await queryInterface.changeColumn('signatureAssets', 'height', {
+      type: Sequelize.INTEGER,
+      allowNull: true,
+    });
+
+    const seen = new Set();
+
+    // 1) recommendation: signatureData의 이미지 blob → {type, hash} (소프트 삭제된 행 포함, 3단계에서 참조로 계산)
+    let lastId = 0;
+    for (;;) {
+      const rows = await queryInterface.sequelize.query(
+        `SELECT id, signatureData FROM recommendation
+          WHERE id > :lastId AND signatureHash IS NULL AND signatureData IS NOT NULL
+          ORDER BY id LIMIT ${BATCH_SIZE}`,
+        { replacements: { lastId }, type: queryInterface.sequelize.QueryTypes.SELECT }
+      );
+      if (rows.length === 0) break;
+      lastId = rows[rows.length - 1].id;
+
+      await queryInterface.sequelize.transaction(async (transaction) => {
+        for (const row of rows) {
+          let signature;
+          try {
+            signature = JSON.parse(row.signatureData);
+          } catch (e) {
+            continue;
+          }
+          if (!signature || !IMAGE_SIGNATURE_TYPES.includes(signature.type) || !signature.data) continue;
+
+          const contentHash = await ensureAsset(queryInterface, transaction, seen, signature.data);
+          await queryInterface.sequelize.query(
+            'UPDATE recommendation SET signatureData = :signatureData, signatureHash = :contentHash WHERE id = :id',
+            {
+              replacements: {
+                signatureData: JSON.stringify({ type: signature.type, hash: contentHash }),
+                contentHash,
+                id: row.id,
+              },
+              transaction,
+            }
+          );
+        }
+      });
+    }
+
+    // 2) userSignatures: 사용자당 1행이라 data는 유지하고 해시만 기록
+    const userRows = await queryInterface.sequelize.query(
+      `SELECT id, signatureData, signatureType FROM userSignatures
+        WHERE signatureHash IS NULL AND signatureData IS NOT NULL`,
+      { type: queryInterface.sequelize.QueryTypes.SELECT }
+    );
+    await queryInterface.sequelize.transaction(async (transaction) => {
+      for (const row of userRows) {
+        if (!IMAGE_SIGNATURE_TYPES.includes(row.signatureType)) continue;
+        const contentHash = await ensureAsset(queryInterface, transaction, seen, row.signatureData);
+        await queryInterface.sequelize.query(
+          'UPDATE userSignatures SET signatureHash = :contentHash WHERE id = :id',
+          { replacements: { contentHash, id: row.id }, transaction }
+        );
+      }
+    });
+
+    // 3) 참조 카운트 재계산 - 소프트 삭제된 행도 해시만 남아 있으므로 참조로 셈
+    //    (살아있는 행만 세면 삭제된 추천서의 유일한 서명 사본이 지워짐)
+    await queryInterface.sequelize.query(`
+      UPDATE signatureAssets
+      SET refCount = (
+          SELECT COUNT(*) FROM recommendation r
+          WHERE r.signatureHash = signatureAssets.contentHash
+        ) + (
+          SELECT COUNT(*) FROM userSignatures us
+          WHERE us.signatureHash = signatureAssets.contentHash
+        )
+    `);
+    await queryInterface.sequelize.query('DELETE FROM signatureAssets WHERE refCount <= 0');
+  },
+
+  async down(queryInterface, Sequelize) {
+    // 해시 참조를 다시 data URL로 풀어서 기록
+    const rows = await queryInterface.sequelize.query(
+      `SELECT r.id, r.signatureData, a.mimeType, a.data
+         FROM recommendation r
+         JOIN signatureAssets a ON a.contentHash = r.signatureHash
+        WHERE r.signatureHash IS NOT NULL`,
+      { type: queryInterface.sequelize.QueryTypes.SELECT }
+    );
+    await queryInterface.sequelize.transaction(async (transaction) => {
+      for (const row of rows) {
+        let signature;
+        try {
+          signature = JSON.parse(row.signatureData);
+        } catch (e) {
+          continue;
+        }
+        const dataUrl = `data:${row.mimeType};base64,${Buffer.from(row.data).toString('base64')}`;
+        await queryInterface.sequelize.query(
+          'UPDATE recommendation SET signatureData = :signatureData WHERE id = :id',
+          {
+            replacements: { signatureData: JSON.stringify({ type: signature.type, data: dataUrl }), id: row.id },
+            transaction,
+          }
+        );
+      }
+    });
+
+    await queryInterface.removeColumn('signatureAssets', 'refCount');
+
+    // width/height NOT NULL 복원 (크기를 모르는 레거시 이미지는 0)
+    await queryInterface.sequelize.query('UPDATE signatureAssets SET width = 0 WHERE width IS NULL');
+    await queryInterface.sequelize.query('UPDATE signatureAssets SET height = 0 WHERE height IS NULL');
+    await queryInterface.changeColumn('signatureAssets', 'width', {
+      type: Sequelize.INTEGER,
+      allowNull: false,
+    });
+    await queryInterface.changeColumn('signatureAssets', 'height', {
+      type: Sequelize.INTEGER,
+      allowNull: false,
+    });
+  },
+};
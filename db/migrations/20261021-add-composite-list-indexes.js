@@ -0,0 +1,82 @@
+// migrations/20261021-add-composite-list-indexes.js
+// 실제 조회 패턴(WHERE <소유자> = ? AND deletedAt IS NULL ORDER BY <정렬키> DESC)에 맞춘 복합 인덱스
+// - PostgreSQL: deletedAt IS NULL 부분(partial) 인덱스, 정렬 방향까지 포함
+// - MySQL: 부분 인덱스가 없으므로 deletedAt을 등치 조건 컬럼으로 끼워 넣음 (IS NULL도 ref 접근 가능)
+// 기존 단일 컬럼 userId/fromUserId/toUserId 인덱스는 새 인덱스의 접두어와 겹치므로 제거
+
+// [테이블, 등치 조건 컬럼, 정렬 컬럼([컬럼, 방향]), 인덱스명]
+const LIVE_INDEXES = [
+  // /my-recommendations, /my-recommendations/sent, /reference-history(UNION ALL 첫 갈래), 일괄 PDF
+  ['recommendation', ['fromUserId'], [['createdAt', 'DESC'], ['id', 'DESC']], 'ix_recommendation_from_live_created'],
+  // /reference-history(UNION ALL 두 번째 갈래), /lookup 추천서 수
+  ['recommendation', ['toUserId'], [['createdAt', 'DESC'], ['id', 'DESC']], 'ix_recommendation_to_live_created'],
+  // /history (필터 없음)
+  ['recommendation', [], [['createdAt', 'DESC'], ['id', 'DESC']], 'ix_recommendation_live_created'],
+  // /my-reputations/sent
+  ['userReputations', ['fromUserId'], [['createdAt', 'DESC'], ['id', 'DESC']], 'ix_userReputations_from_live_created'],
+  // /profile/reputations, 프로필 조회
+  ['userReputations', ['userId'], [['createdAt', 'DESC']], 'ix_userReputations_user_live_created'],
+  // 프로필 항목 (generate 상세정보, /profile/*)
+  ['userExperiences', ['userId'], [['startDate', 'DESC']], 'ix_userExperiences_user_live_start'],
+  ['userAwards', ['userId'], [['awardDate', 'DESC']], 'ix_userAwards_user_live_award'],
+  ['userCertifications', ['userId'], [['issueDate', 'DESC']], 'ix_userCertifications_user_live_issue'],
+  ['userStrengths', ['userId'], [['category', 'ASC'], ['id', 'ASC']], 'ix_userStrengths_user_live_category'],
+  ['userProjects', ['userId'], [['startDate', 'DESC']], 'ix_userProjects_user_live_start'],
+  // /templates
+  ['recommendationTemplates', [], [['createdAt', 'DESC']], 'ix_recommendationTemplates_live_created'],
+  // /my-permissions (UNION ALL 두 갈래)
+  ['userDetailPermissions', ['userId'], [['createdAt', 'DESC']], 'ix_userDetailPermissions_user_live_created'],
+  ['userDetailPermissions', ['ownerEmail'], [['createdAt', 'DESC']], 'ix_userDetailPermissions_owner_live_created'],
+];
+
+// 새 복합 인덱스로 대체되는 기존 인덱스 [테이블, 컬럼, 인덱스명]
+const REDUNDANT_INDEXES = [
+  ['recommendation', ['fromUserId'], 'ix_recommendation_fromWU'],
+  ['recommendation', ['toUserId'], 'ix_recommendation_toWU'],
+  ['userReputations', ['fromUserId'], 'ix_userReputations_fromUserId'],
+  ['userReputations', ['userId'], 'ix_userReputations_userId'],
+  ['userExperiences', ['userId'], 'ix_userExperiences_userId'],
+  ['userAwards', ['userId'], 'ix_userAwards_userId'],
+  ['userCertifications', ['userId'], 'ix_userCertifications_userId'],
+  ['userStrengths', ['userId'], 'ix_userStrengths_userId'],
+  ['userProjects', ['userId'], 'ix_userProjects_userId'],
+  ['userDetailPermissions', ['userId'], 'idx_userId'],
+  ['userDetailPermissions', ['ownerEmail'], 'idx_ownerEmail'],
+];
+
+/** @type {import('sequelize-cli').Migration} */
+module.exports = {
+  async up(queryInterface) {
+    const isPostgres = queryInterface.sequelize.getDialect() === 'postgres';
+
+    for (const [table, equalityFields, orderFields, name] of LIVE_INDEXES) {
+      if (isPostgres) {
+        await queryInterface.addIndex(
+          table,
+          [...equalityFields, ...orderFields.map(([field, order]) => ({ name: field, order }))],
+          { name, where: { deletedAt: null } }
+        );
+      } else {
+        await queryInterface.addIndex(
+          table,
+          [...equalityFields, 'deletedAt', ...orderFields.map(([field]) => field)],
+          { name }
+        );
+      }
+    }
+
+    // 외래키가 걸린 컬럼은 새 인덱스가 생긴 뒤에 기존 인덱스 제거 (MySQL FK 인덱스 요구사항)
+    for (const [table, , name] of REDUNDANT_INDEXES) {
+      await queryInterface.removeIndex(table, name);
+    }
+  },
+
+  async down(queryInterface) {
+    for (const [table, fields, name] of REDUNDANT_INDEXES) {
+      await queryInterface.addIndex(table, fields, { name });
+    }
+    for (const [table, , , name] of LIVE_INDEXES) {
+      await queryInterface.removeIndex(table, name);
+    }
+  },
+};
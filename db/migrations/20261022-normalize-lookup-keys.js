@@ -0,0 +1,83 @@
+// migrations/20261022-normalize-lookup-keys.js
+// 사용자/회사/직책 조회 키 정규화 + 인덱스
+// - 서버는 저장 시점에 NFC + 앞뒤 공백 제거(normalize_lookup_key) 후 컬럼을 그대로 비교
+//   (TRIM(컬럼) 비교는 인덱스를 못 타서 전체 스캔이 발생)
+// - 기존 데이터를 같은 규칙으로 백필한 뒤 조회 컬럼에 인덱스 추가
+// - users.email, workspaceRoles(workspaceId, name)은 기존 유니크 인덱스 사용
+
+const BATCH_SIZE = 500;
+
+// [테이블, 컬럼]
+const LOOKUP_COLUMNS = [
+  ['users', 'nickname'],
+  ['users', 'email'],
+  ['workspaces', 'name'],
+  ['workspaceRoles', 'name'],
+];
+
+// [테이블, 컬럼, 인덱스명]
+const LOOKUP_INDEXES = [
+  ['users', 'nickname', 'ix_users_nickname_live'],
+  ['workspaces', 'name', 'ix_workspaces_name_live'],
+];
+
+function normalizeLookupKey(value) {
+  // Python str.strip()과 같은 공백 집합
+  return value.normalize('NFC').replace(/^\s+|\s+$/g, '');
+}
+
+async function backfillColumn(queryInterface, table, column) {
+  let lastId = 0;
+  let updated = 0;
+  for (;;) {
+    const rows = await queryInterface.sequelize.query(
+      `SELECT id, ${column} AS value FROM ${table}
+        WHERE id > :lastId AND ${column} IS NOT NULL
+        ORDER BY id LIMIT ${BATCH_SIZE}`,
+      { replacements: { lastId }, type: queryInterface.sequelize.QueryTypes.SELECT }
+    );
+    if (rows.length === 0) break;
+    lastId = rows[rows.length - 1].id;
+
+    for (const row of rows) {
+      const normalized = normalizeLookupKey(row.value);
+      if (normalized === row.value) continue;
+      try {
+        await queryInterface.sequelize.query(
+          `UPDATE ${table} SET ${column} = :normalized WHERE id = :id`,
+          { replacements: { normalized, id: row.id } }
+        );
+        updated += 1;
+      } catch (e) {
+        // 유니크 컬럼(email, 직책명)에서 정규화 후 기존 행과 겹치면 원본 유지
+        console.warn(`[normalize-lookup-keys] ${table}.${column} id=${row.id} 건너뜀: ${e.message}`);
+      }
+    }
+  }
+  console.log(`[normalize-lookup-keys] ${table}.${column}: ${updated}건 정규화`);
+}
+
+/** @type {import('sequelize-cli').Migration} */
+module.exports = {
+  async up(queryInterface) {
+    for (const [table, column] of LOOKUP_COLUMNS) {
+      await backfillColumn(queryInterface, table, column);
+    }
+
+    const isPostgres = queryInterface.sequelize.getDialect() === 'postgres';
+    for (const [table, column, name] of LOOKUP_INDEXES) {
+      if (isPostgres) {
+        await queryInterface.addIndex(table, [column], { name, where: { deletedAt: null } });
+      } else {
+        await queryInterface.addIndex(table, [column, 'deletedAt'], { name });
+      }
+    }
+  },
+
+  async down(queryInterface) {
+    // 정규화된 값은 원래 값으로 되돌릴 수 없으므로 인덱스만 제거
+    for (const [table, , name] of LOOKUP_INDEXES) {
+      await queryInterface.removeIndex(table, name);
+    }
+  },
+};
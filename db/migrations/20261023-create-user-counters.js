@@ -0,0 +1,69 @@
+// migrations/20261023-create-user-counters.js
+// 사용자별 보낸/받은 추천서·평판 수 (서버가 쓰기와 같은 트랜잭션에서 증감, 주기적으로 보정)
+const { defaultCreate } = require('../migrationLib/createHelper.cjs');
+
+const COUNTER_COLUMNS = ['sentRecommendations', 'receivedRecommendations', 'sentReputations', 'receivedReputations'];
+
+/** @type {import('sequelize-cli').Migration} */
+module.exports = {
+  async up(queryInterface, Sequelize) {
+    const tableOpts = { charset: 'utf8mb4', collate: 'utf8mb4_unicode_ci' };
+
+    const counterColumns = {};
+    for (const column of COUNTER_COLUMNS) {
+      counterColumns[column] = {
+        type: Sequelize.INTEGER,
+        allowNull: false,
+        defaultValue: 0,
+      };
+    }
+
+    await queryInterface.createTable(
+      'userCounters',
+      {
+        // 공통 컬럼(id, createdAt, updatedAt)
+        ...defaultCreate,
+
+        userId: {
+          type: Sequelize.INTEGER,
+          allowNull: false,
+          references: { model: 'users', key: 'id' },
+          onUpdate: 'CASCADE',
+          onDelete: 'CASCADE',
+        },
+
+        // receivedRecommendations는 자기 자신에게 쓴 추천서 제외
+        ...counterColumns,
+      },
+      tableOpts
+    );
+
+    // 사용자당 1행
+    await queryInterface.addIndex('userCounters', ['userId'], {
+      name: 'ux_userCounters_userId',
+      unique: true,
+    });
+
+    // 기존 데이터 백필
+    await queryInterface.sequelize.query(`
+      INSERT INTO userCounters (userId, ${COUNTER_COLUMNS.join(', ')}, createdAt, updatedAt)
+      SELECT
+        u.id,
+        (SELECT COUNT(*) FROM recommendation r
+          WHERE r.fromUserId = u.id AND r.deletedAt IS NULL),
+        (SELECT COUNT(*) FROM recommendation r
+          WHERE r.toUserId = u.id AND r.fromUserId <> u.id AND r.deletedAt IS NULL),
+        (SELECT COUNT(*) FROM userReputations rp
+          WHERE rp.fromUserId = u.id AND rp.deletedAt IS NULL),
+        (SELECT COUNT(*) FROM userReputations rp
+          WHERE rp.userId = u.id AND rp.deletedAt IS NULL),
+        NOW(),
+        NOW()
+      FROM users u
+    `);
+  },
+
+  async down(queryInterface) {
+    await queryInterface.dropTable('userCounters');
+  },
+};
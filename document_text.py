@@ -0,0 +1,257 @@
+"""
+업로드 문서(TXT, DOCX, PDF) 텍스트 추출
+- 파일 경로 기준으로 페이지/문단 단위로 읽고 max_chars를 채우면 바로 중단
+- TXT 인코딩은 앞부분(ENCODING_SNIFF_BYTES)만 보고 판별
+- 텍스트 레이어가 없는 PDF 페이지(스캔본)는 페이지에 포함된 이미지를 OCR (페이지 단위로 워커에서 실행)
+- server.py와 분리되어 있어 워커 프로세스에서도 가볍게 import 가능
+"""
+
+import io
+import os
+import time
+import codecs
+import hashlib
+from typing import Iterator, List, Optional
+
+import chardet
+import docx
+import PyPDF2
+import pytesseract
+from PIL import Image
+
+SUPPORTED_DOCUMENT_EXTENSIONS = (".txt", ".docx", ".pdf")
+
+ENCODING_SNIFF_BYTES = 64 * 1024
+TEXT_READ_CHUNK_BYTES = 64 * 1024
+
+# 페이지 텍스트 레이어가 이보다 짧으면 스캔 페이지로 보고 OCR 대상
+OCR_MIN_PAGE_CHARS = 20
+OCR_LANG = os.getenv("DOCUMENT_OCR_LANG", "kor+eng")
+OCR_MAX_IMAGE_PIXELS = 40_000_000  # 비정상적으로 큰 이미지는 OCR하지 않음
+
+# chardet가 돌려주는 이름 → 실제 디코딩에 쓸 상위 호환 코덱
+_ENCODING_ALIASES = {
+    "euc-kr": "cp949",
+    "ascii": "utf-8",
+}
+
+
+def document_extension(filename: Optional[str]) -> str:
+    """지원 형식이면 확장자(.pdf 등), 아니면 빈 문자열"""
+    ext = os.path.splitext((filename or "").lower())[1]
+    return ext if ext in SUPPORTED_DOCUMENT_EXTENSIONS else ""
+
+
+def detect_encoding(prefix: bytes) -> str:
+    """앞부분 바이트로 인코딩 판별 (UTF-8 우선, 아니면 chardet)"""
+    if prefix.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    try:
+        # 잘린 마지막 문자는 허용
+        codecs.getincrementaldecoder("utf-8")().decode(prefix, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+    encoding = (chardet.detect(prefix).get("encoding") or "utf-8").lower()
+    return _ENCODING_ALIASES.get(encoding, encoding)
+
+
+def _iter_txt(path: str) -> Iterator[str]:
+    with open(path, "rb") as f:
+        prefix = f.read(ENCODING_SNIFF_BYTES)
+        try:
+            decoder = codecs.getincrementaldecoder(detect_encoding(prefix))(errors="ignore")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+        chunk = prefix
+        while chunk:
+            yield decoder.decode(chunk)
+            chunk = f.read(TEXT_READ_CHUNK_BYTES)
+        yield decoder.decode(b"", final=True)
+
+
+def _iter_docx(path: str) -> Iterator[str]:
+    for paragraph in docx.Document(path).paragraphs:
+        yield paragraph.text + "\n"
+
+
+def _iter_pdf(path: str, max_pages: Optional[int]) -> Iterator[str]:
+    # 경로를 넘기면 PyPDF2가 파일 전체를 메모리로 읽으므로 파일 객체로 전달 (필요한 부분만 seek)
+    with open(path, "rb") as f:
+        reader = PyPDF2.PdfReader(f)
+        for index, page in enumerate(reader.pages):
+            if max_pages is not None and index >= max_pages:
+                break
+            yield (page.extract_text() or "") + "\n"
+
+
+def iter_document_text(path: str, filename: str, max_pages: Optional[int] = None) -> Iterator[str]:
+    """문서를 페이지/문단/청크 단위 텍스트로 순회"""
+    ext = document_extension(filename)
+    if ext == ".txt":
+        return _iter_txt(path)
+    if ext == ".docx":
+        return _iter_docx(path)
+    if ext == ".pdf":
+        return _iter_pdf(path, max_pages)
+    raise ValueError(f"지원하지 않는 파일 형식: {filename}")
+
+
+def extract_document_text(path: str, filename: str, max_chars: Optional[int] = None,
+                          max_pages: Optional[int] = None) -> str:
+    """
+    문서 텍스트 추출 (max_chars를 채우면 나머지 페이지/문단은 읽지 않음)
+
+    Raises:
+        ValueError: 지원하지 않는 형식이거나 파일을 읽을 수 없을 때
+    """
+    parts = []
+    total = 0
+    try:
+        for text in iter_document_text(path, filename, max_pages):
+            if not text:
+                continue
+            parts.append(text)
+            total += len(text)
+            if max_chars is not None and total >= max_chars:
+                break
+    except ValueError:
+        raise
+    except Exception as e:
+        raise ValueError(f"파일 텍스트 추출 실패: {e}")
+    text = "".join(parts).rstrip("\n")
+    return text[:max_chars] if max_chars is not None else text
+
+
+# ===== 스캔 PDF OCR =====
+def _page_image_objects(page) -> list:
+    """페이지 리소스에 포함된 이미지 XObject 목록"""
+    try:
+        xobjects = page["/Resources"]["/XObject"].get_object()
+    except (KeyError, TypeError):
+        return []
+    images = []
+    for name in xobjects:
+        obj = xobjects[name].get_object()
+        if obj.get("/Subtype") == "/Image":
+            images.append(obj)
+    return images
+
+
+def scan_pdf_pages(path: str, max_pages: Optional[int] = None, max_chars: Optional[int] = None) -> List[dict]:
+    """
+    PDF 페이지별 텍스트 레이어 추출 + OCR 필요 여부 판별
+
+    Returns:
+        [{"page": 번호, "text": 텍스트 레이어, "image_hash": OCR 대상이면 이미지 해시, 아니면 None}]
+        - image_hash는 페이지 이미지 원본 데이터의 SHA-256 (같은 스캔 페이지는 다른 문서에서도 같은 키)
+        - 텍스트 레이어만으로 max_chars를 채우면 이후 페이지는 읽지 않음
+    """
+    pages = []
+    total = 0
+    try:
+        with open(path, "rb") as f:
+            reader = PyPDF2.PdfReader(f)
+            for index, page in enumerate(reader.pages):
+                if max_pages is not None and index >= max_pages:
+                    break
+                text = page.extract_text() or ""
+                image_hash = None
+                if len(text.strip()) < OCR_MIN_PAGE_CHARS:
+                    # 크기 제한을 넘는 이미지는 OCR하지 않으므로 압축을 풀기 전에 걸러냄
+                    images = [obj for obj in _page_image_objects(page) if _image_pixels(obj) <= OCR_MAX_IMAGE_PIXELS]
+                    if images:
+                        digest = hashlib.sha256()
+                        for obj in images:
+                            digest.update(obj.get_data())
+                        image_hash = digest.hexdigest()
+                pages.append({"page": index, "text": text, "image_hash": image_hash})
+                total += len(text)
+                if max_chars is not None and total >= max_chars:
+                    break
+    except Exception as e:
+        raise ValueError(f"파일 텍스트 추출 실패: {e}")
+    return pages
+
+
+_COLOR_SPACE_MODES = {"/DeviceRGB": "RGB", "/DeviceGray": "L", "/DeviceCMYK": "CMYK"}
+_ICC_COMPONENT_MODES = {1: "L", 3: "RGB", 4: "CMYK"}
+
+
+def _image_pixels(obj) -> int:
+    """이미지 XObject의 픽셀 수 (스트림 압축을 풀지 않고 사전 값만 읽음)"""
+    try:
+        return int(obj["/Width"]) * int(obj["/Height"])
+    except (KeyError, TypeError, ValueError):
+        return OCR_MAX_IMAGE_PIXELS + 1
+
+
+def _decode_page_image(obj) -> Optional[Image.Image]:
+    """이미지 XObject → PIL 이미지 (지원하지 않는 색 공간/비트 수면 None)"""
+    if _image_pixels(obj) > OCR_MAX_IMAGE_PIXELS:
+        return None
+    size = (int(obj["/Width"]), int(obj["/Height"]))
+    filters = obj.get("/Filter") or []
+    if not isinstance(filters, list):
+        filters = [filters]
+    data = obj.get_data()
+    # JPEG/JPEG2000/팩스 압축은 get_data()가 그대로 열 수 있는 이미지 파일 형태를 돌려줌
+    if any(name in ("/DCTDecode", "/JPXDecode", "/CCITTFaxDecode") for name in filters):
+        return Image.open(io.BytesIO(data))
+
+    bits = int(obj.get("/BitsPerComponent", 1 if obj.get("/ImageMask") else 8))
+    if bits == 1:
+        return Image.frombytes("1", size, data)
+    color_space = obj.get("/ColorSpace")
+    if isinstance(color_space, list) and color_space and color_space[0] == "/ICCBased":
+        mode = _ICC_COMPONENT_MODES.get(int(color_space[1].get_object().get("/N", 0)))
+    else:
+        mode = _COLOR_SPACE_MODES.get(color_space)
+    if bits != 8 or mode is None:
+        return None
+    return Image.frombytes(mode, size, data)
+
+
+def init_ocr_worker():
+    """OCR 워커 초기화 - 페이지 단위로 프로세스 병렬화하므로 tesseract 내부 스레드는 1개로 제한"""
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+
+
+def ocr_available() -> bool:
+    """tesseract 실행 파일 사용 가능 여부"""
+    try:
+        pytesseract.get_tesseract_version()
+        return True
+    except Exception:
+        return False
+
+
+def ocr_pdf_page(path: str, page_index: int, lang: str = OCR_LANG, timeout: Optional[float] = None) -> str:
+    """
+    스캔 PDF 한 페이지를 OCR (페이지에 포함된 이미지를 순서대로 인식)
+    timeout(초)은 페이지 전체 기준 - 넘으면 실행 중인 tesseract 프로세스만 종료 (워커는 계속 사용)
+
+    Raises:
+        ValueError: 페이지를 읽거나 인식할 수 없거나 시간이 초과됐을 때
+    """
+    deadline = time.monotonic() + timeout if timeout else None
+    try:
+        with open(path, "rb") as f:
+            page = PyPDF2.PdfReader(f).pages[page_index]
+            parts = []
+            for obj in _page_image_objects(page):
+                image = _decode_page_image(obj)
+                if image is None:
+                    continue
+                if image.mode not in ("RGB", "L"):
+                    image = image.convert("RGB")
+                remaining = 0
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError("OCR 시간 초과")
+                # pytesseract timeout은 tesseract 서브프로세스를 종료 (0이면 제한 없음)
+                parts.append(pytesseract.image_to_string(image, lang=lang, timeout=remaining).strip())
+    except Exception as e:
+        raise ValueError(f"OCR 실패 (페이지 {page_index + 1}): {e}")
+    return "\n".join(part for part in parts if part)
@@ -26,9 +26,13 @@ if not os.getenv("OPENAI_API_KEY"):
 import re
 import csv
 import json
-from typing import List, Dict, Any, Optional
+import hashlib
+import time
+from typing import List, Dict, Any, Optional, Callable
 from datetime import datetime
 
+import numpy as np
+
 # OpenAI Evals imports (선택사항)
 try:
     from evals.api import CompletionFn
@@ -40,6 +44,231 @@ except ImportError:
     EVALS_AVAILABLE = False
 
 
+# 배치 처리 종료 상태
+BATCH_TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+
+class OpenAIBatchService:
+    """
+    OpenAI Batch API 래퍼
+    
+    JSONL 배치 파일을 업로드하고 배치 작업을 생성한 뒤,
+    완료될 때까지 폴링하여 결과 JSONL 텍스트를 반환합니다.
+    (대화형 API 대비 낮은 비용, 24시간 이내 처리)
+    """
+    
+    def __init__(self, client: Optional[Any] = None, completion_window: str = "24h"):
+        if client is None:
+            from openai import OpenAI
+            client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.client = client
+        self.completion_window = completion_window
+    
+    def submit(self, input_path: str) -> str:
+        """배치 파일 업로드 후 배치 작업 생성, 배치 ID 반환"""
+        with open(input_path, "rb") as f:
+            input_file = self.client.files.create(file=f, purpose="batch")
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=self.completion_window
+        )
+        return batch.id
+    
+    def status(self, batch_id: str) -> str:
+        """배치 작업 상태 조회"""
+        return self.client.batches.retrieve(batch_id).status
+    
+    def fetch_output(self, batch_id: str) -> str:
+        """완료된 배치 작업의 결과 JSONL 텍스트 반환"""
+        batch = self.client.batches.retrieve(batch_id)
+        if not batch.output_file_id:
+            return ""
+        return self.client.files.content(batch.output_file_id).text
+
+
+class FakeBatchService:
+    """
+    로컬 테스트용 가짜 배치 서비스
+    
+    OpenAIBatchService와 같은 인터페이스로 동작하며, 네트워크 호출 없이
+    배치 파일의 각 요청에 responder(prompt) 결과를 채워 결과 JSONL을 만듭니다.
+    """
+    
+    def __init__(self, responder: Callable[[str], str]):
+        self.responder = responder
+        self._outputs: Dict[str, str] = {}
+    
+    def submit(self, input_path: str) -> str:
+        output_lines = []
+        with open(input_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                request = json.loads(line)
+                prompt = request["body"]["messages"][-1]["content"]
+                output_lines.append(json.dumps({
+                    "id": f"batch_req_{len(output_lines)}",
+                    "custom_id": request["custom_id"],
+                    "response": {
+                        "status_code": 200,
+                        "body": {"choices": [{"message": {"role": "assistant", "content": self.responder(prompt)}}]}
+                    },
+                    "error": None
+                }, ensure_ascii=False))
+        batch_id = f"fake_batch_{len(self._outputs) + 1}"
+        self._outputs[batch_id] = "\n".join(output_lines)
+        return batch_id
+    
+    def status(self, batch_id: str) -> str:
+        return "completed" if batch_id in self._outputs else "failed"
+    
+    def fetch_output(self, batch_id: str) -> str:
+        return self._outputs.get(batch_id, "")
+
+
+class HeuristicScorer:
+    """
+    로컬 휴리스틱 사전 평가기 (네트워크 호출 없음, 수 ms 이내)
+    
+    문단 수, 문장 길이 분산, 구체적 정보(숫자/날짜) 밀도, 반복 비율, 목표 글자수 달성도 등
+    텍스트 특징을 NumPy로 계산하여 RecoEvaluator의 5가지 기준을 근사합니다.
+    GPT 평가를 대체하지 않으며, 문제가 의심될 때만 전체 평가를 요청하는 용도입니다.
+    """
+    
+    # 추천서 본문이 아닌 줄 (제목, 날짜, 작성자 정보)
+    NON_BODY_LINE_PATTERN = re.compile(
+        r"^(추천서|작성자:|소속/직위:|연락처:|서명:|\d{4}년\s*\d{1,2}월\s*\d{1,2}일)"
+    )
+    SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?。])\s+")
+    # 숫자, 날짜, 수치 표현 (예: 2023년, 30%, 15명)
+    SPECIFIC_PATTERN = re.compile(r"\d+(?:[.,]\d+)?\s*(?:%|퍼센트|년|월|일|명|개|건|배|점|시간|주|개월|억|만)?")
+    # 과장/추상적 칭찬 표현
+    HYPERBOLE_PATTERN = re.compile(r"최고의|완벽|독보적|타의 추종|누구보다|가장 뛰어난|비교할 수 없")
+    # 추천 의사 표현
+    RECOMMEND_PATTERN = re.compile(r"추천|적극|확신")
+    
+    # 이 점수 이하인 항목이 있거나 글자수 오차가 허용치를 넘으면 전체 평가 권장
+    FLAG_SCORE_THRESHOLD = 2
+    LENGTH_TOLERANCE = 0.15
+    
+    @classmethod
+    def extract_letter_body(cls, text: str) -> str:
+        """제목/날짜/작성자 정보를 제외한 추천서 본문 반환"""
+        lines = [
+            line for line in (text or "").split("\n")
+            if not cls.NON_BODY_LINE_PATTERN.match(line.strip())
+        ]
+        return "\n".join(lines).strip()
+    
+    def extract_features(self, text: str, word_count: Optional[int] = None) -> Dict[str, float]:
+        """
+        추천서 텍스트 특징 계산
+        
+        Args:
+            text: 추천서 텍스트
+            word_count: 목표 본문 글자수 (선택)
+            
+        Returns:
+            Dict[str, float]: 텍스트 특징
+        """
+        body = self.extract_letter_body(text)
+        body_length = len(body)
+        
+        paragraphs = [p for p in re.split(r"\n\s*\n", body) if p.strip()]
+        sentences = [s for s in self.SENTENCE_SPLIT_PATTERN.split(body.replace("\n", " ")) if s.strip()]
+        sentence_lengths = np.array([len(s) for s in sentences], dtype=np.float64)
+        if sentence_lengths.size == 0:
+            sentence_lengths = np.zeros(1)
+        
+        mean_sentence = float(sentence_lengths.mean())
+        sentence_cv = float(sentence_lengths.std() / mean_sentence) if mean_sentence else 0.0
+        
+        tokens = np.array(body.split())
+        if tokens.size:
+            _, counts = np.unique(tokens, return_counts=True)
+            repetition_ratio = float((counts - 1).sum() / tokens.size)
+        else:
+            repetition_ratio = 0.0
+        
+        per_1k = 1000.0 / body_length if body_length else 0.0
+        length_error = abs(body_length - word_count) / word_count if word_count else 0.0
+        
+        return {
+            "body_length": body_length,
+            "paragraph_count": len(paragraphs),
+            "sentence_count": len(sentences),
+            "mean_sentence_length": round(mean_sentence, 2),
+            "sentence_length_variance": round(float(sentence_lengths.var()), 2),
+            "sentence_length_cv": round(sentence_cv, 3),
+            "specifics_per_1k": round(len(self.SPECIFIC_PATTERN.findall(body)) * per_1k, 2),
+            "hyperbole_per_1k": round(len(self.HYPERBOLE_PATTERN.findall(body)) * per_1k, 2),
+            "recommend_mentions": len(self.RECOMMEND_PATTERN.findall(body)),
+            "repetition_ratio": round(repetition_ratio, 3),
+            "length_error": round(length_error, 3)
+        }
+    
+    def score(self, text: str, word_count: Optional[int] = None) -> Dict[str, Any]:
+        """
+        5가지 기준의 근사 점수 계산
+        
+        Args:
+            text: 추천서 텍스트
+            word_count: 목표 본문 글자수 (선택)
+            
+        Returns:
+            Dict: scores(1-5), average_score, percentage, features, issues, needs_full_evaluation
+        """
+        f = self.extract_features(text, word_count)
+        
+        # 각 특징을 0~1 품질값으로 변환 (np.interp: 구간 선형 보간)
+        specifics = np.interp(f["specifics_per_1k"], [0, 2, 8], [0.0, 0.5, 1.0])
+        hyperbole = np.interp(f["hyperbole_per_1k"], [0, 1, 4], [1.0, 0.7, 0.0])
+        repetition = np.interp(f["repetition_ratio"], [0.1, 0.25, 0.45], [1.0, 0.6, 0.0])
+        structure = np.interp(f["paragraph_count"], [1, 3, 4], [0.0, 0.8, 1.0])
+        # 문장 길이가 너무 균일하거나(단조로움) 들쭉날쭉하면 감점
+        rhythm = np.interp(f["sentence_length_cv"], [0.0, 0.25, 0.6, 1.0], [0.4, 1.0, 1.0, 0.3])
+        sentence_size = np.interp(f["mean_sentence_length"], [15, 30, 90, 150], [0.3, 1.0, 1.0, 0.2])
+        recommend = np.interp(f["recommend_mentions"], [0, 1, 3], [0.0, 0.7, 1.0])
+        length_fit = np.interp(f["length_error"], [0, self.LENGTH_TOLERANCE, 0.5], [1.0, 0.7, 0.0])
+        
+        quality = {
+            "accuracy": 0.5 * specifics + 0.5 * hyperbole,
+            "professionalism": 0.4 * repetition + 0.3 * rhythm + 0.3 * sentence_size,
+            "coherence": 0.5 * structure + 0.3 * rhythm + 0.2 * length_fit,
+            "personalization": 0.7 * specifics + 0.3 * repetition,
+            "persuasiveness": 0.5 * recommend + 0.3 * specifics + 0.2 * length_fit
+        }
+        keys = list(quality)
+        values = np.clip(np.rint(1 + 4 * np.array([quality[k] for k in keys])), 1, 5).astype(int)
+        scores = {key: int(value) for key, value in zip(keys, values)}
+        
+        issues = []
+        if f["paragraph_count"] < 3:
+            issues.append("문단 수가 3개 미만입니다.")
+        if f["specifics_per_1k"] < 2:
+            issues.append("숫자·날짜 등 구체적 정보가 부족합니다.")
+        if f["repetition_ratio"] > 0.25:
+            issues.append("같은 표현이 자주 반복됩니다.")
+        if f["hyperbole_per_1k"] > 1:
+            issues.append("과장된 표현이 많습니다.")
+        if word_count and f["length_error"] > self.LENGTH_TOLERANCE:
+            issues.append(f"목표 글자수({word_count}자)와 {f['body_length']}자로 차이가 큽니다.")
+        
+        average_score = round(float(values.mean()), 2)
+        return {
+            "scores": scores,
+            "average_score": average_score,
+            "percentage": round((average_score - 1) / 4 * 100, 2),
+            "features": f,
+            "issues": issues,
+            "needs_full_evaluation": bool(
+                values.min() <= self.FLAG_SCORE_THRESHOLD
+                or (word_count and f["length_error"] > self.LENGTH_TOLERANCE)
+            )
+        }
+
+
 class RecoEvaluator:
     """추천서 자동 평가 클래스"""
     
@@ -48,12 +277,15 @@ class RecoEvaluator:
         completion_fn: Optional[Any] = None,
         model: str = "gpt-4",
         temperature: float = 0.3,
-        output_dir: str = "eval_results"
+        output_dir: str = "eval_results",
+        structured_output: bool = False
     ):
         self.completion_fn = completion_fn
         self.model = model
         self.temperature = temperature
         self.output_dir = output_dir
+        # True면 JSON Schema 구조화 출력으로 점수/이유를 받음 (json_schema 지원 모델 필요, 예: gpt-4o)
+        self.structured_output = structured_output
         
         # 평가 기준 정의
         self.criteria = {
@@ -202,7 +434,14 @@ class RecoEvaluator:
    - 3점: 추천 의사는 있으나 근거가 약하거나 설득력이 보통 수준
    - 2점: 추천 의사가 명확하지 않거나 근거가 매우 빈약함
    - 1점: 추천 의사가 불분명하고 설득력이 없음
-
+"""
+        if self.structured_output:
+            # 응답 형식은 JSON Schema로 강제되므로 간단한 안내만 추가
+            prompt += """
+각 항목의 score(1~5 정수)와 reason(한 줄 이유)을 JSON으로 응답하세요.
+"""
+        else:
+            prompt += """
 응답 형식 (반드시 아래 형식을 정확히 따라주세요):
 정확성: X점 - [한 줄 이유]
 전문성: X점 - [한 줄 이유]
@@ -214,6 +453,71 @@ class RecoEvaluator:
 """
         return prompt
     
+    def build_response_schema(self) -> Dict[str, Any]:
+        """
+        구조화 출력용 JSON Schema (response_format) 생성
+        
+        Returns:
+            Dict: 항목별 {score: 1-5 정수, reason: 문자열} 스키마
+        """
+        item_schema = {
+            "type": "object",
+            "properties": {
+                "score": {"type": "integer", "enum": [1, 2, 3, 4, 5]},
+                "reason": {"type": "string"}
+            },
+            "required": ["score", "reason"],
+            "additionalProperties": False
+        }
+        return {
+            "type": "json_schema",
+            "json_schema": {
+                "name": "recommendation_evaluation",
+                "strict": True,
+                "schema": {
+                    "type": "object",
+                    "properties": {key: item_schema for key in self.criteria},
+                    "required": list(self.criteria),
+                    "additionalProperties": False
+                }
+            }
+        }
+    
+    def extract_structured_scores(self, response: str) -> tuple:
+        """
+        구조화 출력(JSON) 응답에서 점수와 이유를 한 번에 추출 및 검증
+        
+        Args:
+            response: JSON Schema를 따르는 모델 응답 텍스트
+            
+        Returns:
+            tuple: (항목별 점수 Dict[str, int], 항목별 이유 Dict[str, str])
+            
+        Raises:
+            ValueError: JSON이 아니거나 항목 누락, 점수가 1-5 정수가 아닌 경우
+        """
+        try:
+            data = json.loads(response)
+        except (TypeError, json.JSONDecodeError) as e:
+            raise ValueError(f"평가 응답이 올바른 JSON이 아닙니다: {e}")
+        
+        if not isinstance(data, dict):
+            raise ValueError("평가 응답이 JSON 객체가 아닙니다.")
+        
+        scores = {}
+        reasons = {}
+        for key in self.criteria:
+            item = data.get(key)
+            if not isinstance(item, dict):
+                raise ValueError(f"평가 응답에 {key} 항목이 없습니다.")
+            score = item.get("score")
+            if isinstance(score, bool) or not isinstance(score, int) or not 1 <= score <= 5:
+                raise ValueError(f"{key} 점수가 1-5 정수가 아닙니다: {score!r}")
+            scores[key] = score
+            reasons[key] = str(item.get("reason") or "").strip()
+        
+        return scores, reasons
+    
     def extract_scores_from_response(self, response: str) -> Dict[str, int]:
         """
         모델 응답에서 점수 추출
@@ -272,6 +576,43 @@ class RecoEvaluator:
         percentage = ((average_score - 1) / 4) * 100
         return round(percentage, 2)
     
+    @staticmethod
+    def content_hash(recommendation_text: str) -> str:
+        """
+        추천서 본문의 내용 해시 (중복 평가 제거 / 캐시 키용)
+        
+        Args:
+            recommendation_text: 추천서 텍스트
+            
+        Returns:
+            str: 앞뒤 공백을 제거한 본문의 SHA-256 hex digest
+        """
+        normalized = (recommendation_text or "").strip()
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+    
+    def build_chat_request(self, prompt: str) -> Dict[str, Any]:
+        """
+        Chat Completions 요청 본문 생성 (대화형 호출과 배치 파일에서 공통 사용)
+        
+        Args:
+            prompt: 평가 프롬프트
+            
+        Returns:
+            Dict: chat.completions.create 인자
+        """
+        request = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": "당신은 추천서 품질을 평가하는 전문가입니다."},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": self.temperature,
+            "max_tokens": 500
+        }
+        if self.structured_output:
+            request["response_format"] = self.build_response_schema()
+        return request
+    
     def call_gpt_model(self, prompt: str) -> str:
         """
         GPT 모델 호출 (OpenAI >= 1.0.0 방식)
@@ -296,15 +637,7 @@ class RecoEvaluator:
             
             client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
             
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "당신은 추천서 품질을 평가하는 전문가입니다."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=self.temperature,
-                max_tokens=500
-            )
+            response = client.chat.completions.create(**self.build_chat_request(prompt))
             
             return response.choices[0].message.content
         except Exception as e:
@@ -329,8 +662,28 @@ class RecoEvaluator:
         # GPT 모델 호출
         response = self.call_gpt_model(prompt)
         
-        # 점수 추출
-        scores = self.extract_scores_from_response(response)
+        return self.build_evaluation_result(recommendation, response)
+    
+    def build_evaluation_result(self, recommendation: Dict[str, Any], response: str) -> Dict[str, Any]:
+        """
+        모델 응답으로 평가 결과 구성
+        
+        Args:
+            recommendation: 추천서 데이터
+            response: GPT 모델 응답 텍스트
+            
+        Returns:
+            Dict: 평가 결과
+            
+        Raises:
+            ValueError: 구조화 출력 모드에서 응답 검증에 실패한 경우
+        """
+        # 점수 추출 (구조화 출력 모드는 이유까지 한 번에 검증)
+        reasons = None
+        if self.structured_output:
+            scores, reasons = self.extract_structured_scores(response)
+        else:
+            scores = self.extract_scores_from_response(response)
         
         # 퍼센트 계산
         percentage = self.calculate_percentage(scores)
@@ -347,6 +700,8 @@ class RecoEvaluator:
             "raw_response": response,
             "evaluated_at": datetime.now().isoformat()
         }
+        if reasons is not None:
+            result["reasons"] = reasons
         
         return result
     
@@ -384,6 +739,114 @@ class RecoEvaluator:
         
         return results
     
+    def write_batch_file(self, recommendations: List[Dict[str, Any]], filename: Optional[str] = None) -> str:
+        """
+        평가 프롬프트를 OpenAI Batch API 입력 형식(JSONL)으로 저장
+        
+        Args:
+            recommendations: 추천서 목록
+            filename: 저장할 파일명 (None이면 자동 생성)
+            
+        Returns:
+            str: 저장된 배치 파일 경로
+        """
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"reco_eval_batch_{timestamp}.jsonl"
+        
+        filepath = os.path.join(self.output_dir, filename)
+        
+        with open(filepath, 'w', encoding='utf-8') as batch_file:
+            for recommendation in recommendations:
+                prompt = self.create_evaluation_prompt(recommendation["text"])
+                batch_file.write(json.dumps({
+                    "custom_id": f"reco-{recommendation['id']}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": self.build_chat_request(prompt)
+                }, ensure_ascii=False) + "\n")
+        
+        print(f"✅ 배치 파일이 저장되었습니다: {filepath} ({len(recommendations)}건)")
+        return filepath
+    
+    def parse_batch_output(self, output_text: str, recommendations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        배치 결과(JSONL)를 평가 결과 리스트로 변환
+        
+        Args:
+            output_text: 배치 결과 JSONL 텍스트
+            recommendations: 배치에 포함된 추천서 목록
+            
+        Returns:
+            List[Dict]: 평가 결과 (입력 순서 유지, 실패 건 제외)
+        """
+        responses = {}
+        for line in output_text.splitlines():
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            response = item.get("response") or {}
+            if item.get("error") or response.get("status_code") != 200:
+                print(f"  ❌ 배치 요청 실패 ({item.get('custom_id')}): {item.get('error')}")
+                continue
+            responses[item["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+        
+        results = []
+        for recommendation in recommendations:
+            response = responses.get(f"reco-{recommendation['id']}")
+            if response is None:
+                print(f"  ❌ 추천서 ID {recommendation['id']} 배치 결과 없음")
+                continue
+            try:
+                results.append(self.build_evaluation_result(recommendation, response))
+            except ValueError as e:
+                print(f"  ❌ 추천서 ID {recommendation['id']} 응답 검증 실패: {e}")
+        
+        return results
+    
+    def evaluate_all_recommendations_batch(
+        self,
+        batch_service: Optional[Any] = None,
+        poll_interval: float = 30.0,
+        timeout: float = 24 * 60 * 60
+    ) -> List[Dict[str, Any]]:
+        """
+        모든 추천서를 배치 모드로 평가 (대량 평가용)
+        
+        Args:
+            batch_service: 배치 서비스 (None이면 OpenAIBatchService)
+            poll_interval: 상태 확인 간격 (초)
+            timeout: 최대 대기 시간 (초)
+            
+        Returns:
+            List[Dict]: 전체 평가 결과
+        """
+        recommendations = self.fetch_recommendations_from_db()
+        if not recommendations:
+            return []
+        
+        batch_service = batch_service or OpenAIBatchService()
+        
+        print(f"총 {len(recommendations)}개의 추천서를 배치 모드로 평가합니다...")
+        batch_path = self.write_batch_file(recommendations)
+        batch_id = batch_service.submit(batch_path)
+        print(f"배치 작업 제출 완료: {batch_id}")
+        
+        started_at = time.monotonic()
+        status = batch_service.status(batch_id)
+        while status not in BATCH_TERMINAL_STATUSES:
+            if time.monotonic() - started_at > timeout:
+                print(f"  ❌ 배치 작업 대기 시간 초과: {batch_id}")
+                return []
+            time.sleep(poll_interval)
+            status = batch_service.status(batch_id)
+        
+        if status != "completed":
+            print(f"  ❌ 배치 작업 실패 (상태: {status})")
+            return []
+        
+        return self.parse_batch_output(batch_service.fetch_output(batch_id), recommendations)
+    
     def export_to_csv(self, results: List[Dict[str, Any]], filename: Optional[str] = None) -> str:
         """
         평가 결과를 CSV 파일로 저장
@@ -455,10 +918,14 @@ class RecoEvaluator:
         print(f"✅ 상세 결과가 저장되었습니다: {filepath}")
         return filepath
     
-    def run_evaluation(self) -> Dict[str, Any]:
+    def run_evaluation(self, use_batch: bool = False, batch_service: Optional[Any] = None) -> Dict[str, Any]:
         """
         전체 평가 프로세스 실행
         
+        Args:
+            use_batch: True면 Batch API로 일괄 평가 (야간 작업 등 대량 평가용)
+            batch_service: 배치 서비스 (None이면 OpenAIBatchService)
+            
         Returns:
             Dict: 평가 요약 정보
         """
@@ -467,7 +934,10 @@ class RecoEvaluator:
         print("=" * 60)
         
         # 평가 실행
-        results = self.evaluate_all_recommendations()
+        if use_batch:
+            results = self.evaluate_all_recommendations_batch(batch_service)
+        else:
+            results = self.evaluate_all_recommendations()
         
         if not results:
             print("\n❌ 평가할 추천서가 없습니다.")
@@ -521,15 +991,23 @@ class RecoEvaluator:
 
 # 실행 예제
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="추천서 자동 평가")
+    parser.add_argument("--batch", action="store_true", help="OpenAI Batch API로 일괄 평가")
+    parser.add_argument("--structured", action="store_true", help="JSON Schema 구조화 출력으로 평가 (gpt-4o 사용)")
+    args = parser.parse_args()
+    
     # Evaluator 인스턴스 생성
     evaluator = RecoEvaluator(
-        model="gpt-4",
+        model="gpt-4o" if args.structured else "gpt-4",
         temperature=0.3,
-        output_dir="eval_results"
+        output_dir="eval_results",
+        structured_output=args.structured
     )
     
     # 평가 실행
-    summary = evaluator.run_evaluation()
+    summary = evaluator.run_evaluation(use_batch=args.batch)
     
     # 결과 확인
     print("\n평가 시스템이 완료되었습니다.")
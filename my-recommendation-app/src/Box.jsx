@@ -1,4 +1,4 @@
-import { useEffect, useState } from "react";
+import { useEffect, useRef, useState } from "react";
 
 /**
  * Box.jsx (보관함 화면)
@@ -247,9 +247,26 @@ function Accordion({ title, defaultOpen = true, children }) {
   );
 }
 
-function RecommendationItem({ compactTitle, meta, content, onDelete, itemId }) {
+function RecommendationItem({ compactTitle, meta, excerpt, onDelete, itemId, token }) {
   const [open, setOpen] = useState(false);
   const [deleting, setDeleting] = useState(false);
+  // 목록에는 발췌만 오므로 처음 펼칠 때 전체 본문을 조회
+  const [content, setContent] = useState(null);
+
+  const handleToggle = async () => {
+    const next = !open;
+    setOpen(next);
+    if (!next || content !== null) return;
+    try {
+      const res = await fetch(`${API_BASE}/recommendations/${itemId}`, {
+        headers: { Authorization: `Bearer ${token}` },
+      });
+      const json = await res.json();
+      setContent(res.ok ? json?.content || "" : excerpt);
+    } catch {
+      setContent(excerpt);
+    }
+  };
 
   const handleDelete = async (e) => {
     e.stopPropagation();
@@ -266,7 +283,7 @@ function RecommendationItem({ compactTitle, meta, content, onDelete, itemId }) {
 
   return (
     <div style={styles.listItem}>
-      <div style={styles.listHeader} onClick={() => setOpen(!open)}>
+      <div style={styles.listHeader} onClick={handleToggle}>
         <div style={{ display: "flex", alignItems: "center", gap: 8, flex: 1 }}>
           <span style={styles.tag}>{meta}</span>
           <strong style={{ fontSize: 14 }}>{compactTitle}</strong>
@@ -286,18 +303,38 @@ function RecommendationItem({ compactTitle, meta, content, onDelete, itemId }) {
           <span style={{ color: "#9ca3af", fontWeight: 700 }}>{open ? "▲" : "▼"}</span>
         </div>
       </div>
+      {!open && excerpt && (
+        <div style={{ marginTop: 6, fontSize: 13, color: "#6b7280" }}>{excerpt}</div>
+      )}
       {open && (
         <div style={{ marginTop: 10, whiteSpace: "pre-wrap", lineHeight: 1.7, color: "#1f2937" }}>
-          {content}
+          {content === null ? "불러오는 중..." : content}
         </div>
       )}
     </div>
   );
 }
 
-function ReputationItem({ item, onDelete }) {
+function ReputationItem({ item, onDelete, token }) {
   const [open, setOpen] = useState(false);
   const [deleting, setDeleting] = useState(false);
+  // 발췌가 잘린 코멘트는 처음 펼칠 때 전체를 조회
+  const [comment, setComment] = useState(item.comment_truncated ? null : item.comment_excerpt);
+
+  const handleToggle = async () => {
+    const next = !open;
+    setOpen(next);
+    if (!next || comment !== null) return;
+    try {
+      const res = await fetch(`${API_BASE}/my-reputations/sent/${item.id}`, {
+        headers: { Authorization: `Bearer ${token}` },
+      });
+      const json = await res.json();
+      setComment(res.ok ? json?.comment || "" : item.comment_excerpt);
+    } catch {
+      setComment(item.comment_excerpt);
+    }
+  };
 
   const handleDelete = async (e) => {
     e.stopPropagation();
@@ -314,7 +351,7 @@ function ReputationItem({ item, onDelete }) {
 
   return (
     <div style={styles.listItem}>
-      <div style={styles.listHeader} onClick={() => setOpen(!open)}>
+      <div style={styles.listHeader} onClick={handleToggle}>
         <div style={{ display: "flex", alignItems: "center", gap: 8, flex: 1, flexWrap: "wrap" }}>
           <span style={styles.tag}>{item.category || "평판"}</span>
           <strong style={{ fontSize: 14 }}>
@@ -348,9 +385,12 @@ function ReputationItem({ item, onDelete }) {
       </div>
       {open && (
         <div style={{ marginTop: 10 }}>
-          {item.comment && (
+          {comment === null && (
+            <div style={{ color: "#6b7280", marginBottom: 8 }}>불러오는 중...</div>
+          )}
+          {comment && (
             <div style={{ whiteSpace: "pre-wrap", lineHeight: 1.7, color: "#1f2937", marginBottom: 8 }}>
-              {item.comment}
+              {comment}
             </div>
           )}
           {item.created_at && (
@@ -369,51 +409,51 @@ export default function Box({ user, token, onBackHome, initialTab = "recommendat
   const [activeTab, setActiveTab] = useState(initialTab); // "recommendations" or "reputations"
   const [loading, setLoading] = useState(false);
   const [sent, setSent] = useState([]);
+  const [sentCursor, setSentCursor] = useState(null);
   const [reputations, setReputations] = useState([]);
+  const [reputationsCursor, setReputationsCursor] = useState(null);
   const [error, setError] = useState(null);
   const [searchQuery, setSearchQuery] = useState("");
+  // 검색어를 빠르게 바꿀 때 늦게 도착한 이전 응답이 목록을 덮어쓰지 않도록 요청 순번을 기록
+  const requestSeq = useRef(0);
 
-  // 추천서 데이터 로드
-  useEffect(() => {
-    if (!token || !user?.email) return;
-    const fetchSent = async () => {
-      setLoading(true);
-      setError(null);
-      try {
-        const res = await fetch("http://localhost:8000/my-recommendations/sent", {
-          headers: { Authorization: `Bearer ${token}` },
-        });
-        const json = await res.json();
-        setSent(json?.items || []);
-      } catch {
-        setError("보관함 데이터를 불러오지 못했습니다.");
-      } finally {
-        setLoading(false);
-      }
-    };
-    fetchSent();
-  }, [token, user?.email]);
+  // 목록 한 페이지 로드 (검색은 서버에서, cursor가 있으면 다음 페이지를 뒤에 붙임)
+  const fetchPage = async (path, cursor, setItems, setCursor) => {
+    const seq = ++requestSeq.current;
+    setLoading(true);
+    setError(null);
+    try {
+      const params = new URLSearchParams({ fields: "excerpt", limit: "20" });
+      if (cursor) params.set("cursor", cursor);
+      if (searchQuery.trim()) params.set("q", searchQuery.trim());
+      const res = await fetch(`${API_BASE}${path}?${params}`, {
+        headers: { Authorization: `Bearer ${token}` },
+      });
+      const json = await res.json();
+      if (seq !== requestSeq.current) return;
+      const items = json?.items || [];
+      setItems((prev) => (cursor ? [...prev, ...items] : items));
+      setCursor(json?.next_cursor || null);
+    } catch {
+      if (seq === requestSeq.current) setError("보관함 데이터를 불러오지 못했습니다.");
+    } finally {
+      if (seq === requestSeq.current) setLoading(false);
+    }
+  };
 
-  // 평판 데이터 로드
+  // 현재 탭 목록 로드 (검색어 입력은 잠시 멈춘 뒤 서버에 조회)
   useEffect(() => {
     if (!token || !user?.email) return;
-    const fetchReputations = async () => {
-      setLoading(true);
-      setError(null);
-      try {
-        const res = await fetch("http://localhost:8000/my-reputations/sent", {
-          headers: { Authorization: `Bearer ${token}` },
-        });
-        const json = await res.json();
-        setReputations(json?.items || []);
-      } catch {
-        setError("보관함 데이터를 불러오지 못했습니다.");
-      } finally {
-        setLoading(false);
+    const timer = setTimeout(() => {
+      if (activeTab === "recommendations") {
+        fetchPage("/my-recommendations/sent", null, setSent, setSentCursor);
+      } else {
+        fetchPage("/my-reputations/sent", null, setReputations, setReputationsCursor);
       }
-    };
-    fetchReputations();
-  }, [token, user?.email]);
+    }, searchQuery ? 300 : 0);
+    return () => clearTimeout(timer);
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [token, user?.email, activeTab, searchQuery]);
 
   // 추천서 삭제 핸들러
   const handleDeleteRecommendation = async (itemId) => {
@@ -445,23 +485,6 @@ export default function Box({ user, token, onBackHome, initialTab = "recommendat
     alert("평판이 삭제되었습니다.");
   };
 
-  // 추천서 검색 필터링
-  const filteredSent = sent.filter((item) => {
-    if (!searchQuery.trim()) return true;
-    const query = searchQuery.toLowerCase();
-    const requesterName = (item.requester_name || item.to || "").toLowerCase();
-    return requesterName.includes(query);
-  });
-
-  // 평판 검색 필터링
-  const filteredReputations = reputations.filter((item) => {
-    if (!searchQuery.trim()) return true;
-    const query = searchQuery.toLowerCase();
-    const targetName = (item.target_name || "").toLowerCase();
-    const targetEmail = (item.target_email || "").toLowerCase();
-    return targetName.includes(query) || targetEmail.includes(query);
-  });
-
   // 탭 전환 시 검색어 초기화 및 상위 컴포넌트에 알림
   const handleTabChange = (tab) => {
     setActiveTab(tab);
@@ -538,21 +561,31 @@ export default function Box({ user, token, onBackHome, initialTab = "recommendat
             <div style={{ marginBottom: 8, color: "#6b7280" }}>
               로그인한 계정으로 작성한 추천서 목록입니다. 각 항목을 클릭하면 내용이 펼쳐집니다.
             </div>
-            {filteredSent.length === 0 && (
+            {sent.length === 0 && (
               <div style={{ ...styles.card }}>
                 {searchQuery ? "검색 결과가 없습니다." : "작성한 추천서가 없습니다."}
               </div>
             )}
-            {filteredSent.map((it) => (
+            {sent.map((it) => (
               <RecommendationItem
                 key={it.id}
                 itemId={it.id}
                 meta={new Date(it.created_at).toLocaleString()}
                 compactTitle={`요청자: ${it.requester_name || it.to || "대상자"}`}
-                content={it.content || it.recommendation || ""}
+                excerpt={it.excerpt || ""}
+                token={token}
                 onDelete={handleDeleteRecommendation}
               />
             ))}
+            {sentCursor && (
+              <button
+                style={styles.button}
+                disabled={loading}
+                onClick={() => fetchPage("/my-recommendations/sent", sentCursor, setSent, setSentCursor)}
+              >
+                {loading ? "불러오는 중..." : "더 보기"}
+              </button>
+            )}
           </Accordion>
         </div>
       )}
@@ -573,18 +606,28 @@ export default function Box({ user, token, onBackHome, initialTab = "recommendat
             <div style={{ marginBottom: 8, color: "#6b7280" }}>
               로그인한 계정으로 작성한 평판 목록입니다. 각 항목을 클릭하면 내용이 펼쳐집니다.
             </div>
-            {filteredReputations.length === 0 && (
+            {reputations.length === 0 && (
               <div style={{ ...styles.card }}>
                 {searchQuery ? "검색 결과가 없습니다." : "작성한 평판이 없습니다."}
               </div>
             )}
-            {filteredReputations.map((item) => (
+            {reputations.map((item) => (
               <ReputationItem
                 key={item.id}
                 item={item}
+                token={token}
                 onDelete={handleDeleteReputation}
               />
             ))}
+            {reputationsCursor && (
+              <button
+                style={styles.button}
+                disabled={loading}
+                onClick={() => fetchPage("/my-reputations/sent", reputationsCursor, setReputations, setReputationsCursor)}
+              >
+                {loading ? "불러오는 중..." : "더 보기"}
+              </button>
+            )}
           </Accordion>
         </div>
       )}
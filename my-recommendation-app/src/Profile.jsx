@@ -340,6 +340,10 @@ export default function Profile({ initialSection: _initialSection, onLoaded, loa
   const [openRepForm, setOpenRepForm] = useState(false);
   const [searchingUser, setSearchingUser] = useState(false);
 
+  // 이력서 가져오기 상태 (early return 전에 선언해야 훅 순서가 유지됨)
+  const [resumeImport, setResumeImport] = useState(null);
+  const [importingResume, setImportingResume] = useState(false);
+
   // 사용자 검색 (이메일로) - 콜백 함수 지원 - useCallback으로 메모이제이션하여 안정적인 참조 유지
   // early return 전에 정의해야 함
   const searchUserByEmail = React.useCallback(async (email, setSearchedUserCallback = null) => {
@@ -613,6 +617,52 @@ export default function Profile({ initialSection: _initialSection, onLoaded, loa
   const updateStrength = async (row, d) => { await put(`/profile/strengths/${row.id}`, d); await loadAll(); setEditRow({ type: null, data: null }); window.alert("수정했습니다."); };
   const deleteStrength = async (id) => { await del(`/profile/strengths/${id}`); await loadAll(); window.alert("삭제했습니다."); };
 
+  // 이력서 가져오기: 분석(미리보기) → 확인 후 한 번에 저장
+  const IMPORT_KINDS = [
+    { key: "experiences", label: "경력", title: (x) => `${x.company} · ${x.position}` },
+    { key: "awards", label: "수상이력", title: (x) => x.title },
+    { key: "certifications", label: "자격증", title: (x) => x.name },
+    { key: "projects", label: "프로젝트", title: (x) => x.title },
+    { key: "strengths", label: "강점", title: (x) => x.strength },
+  ];
+  const parseResume = async (file) => {
+    if (!file) return;
+    setImportingResume(true);
+    try {
+      const formData = new FormData();
+      formData.append("file", file);
+      const t = localStorage.getItem("token");
+      const r = await fetch(`${API_BASE}/profile/import/parse`, {
+        method: "POST",
+        headers: t ? { Authorization: `Bearer ${t}` } : {},
+        body: formData,
+      });
+      const j = await r.json().catch(() => ({}));
+      if (!r.ok) throw new Error(j.detail || r.statusText);
+      setResumeImport(j.items);
+    } catch (e) {
+      window.alert(`이력서 분석 실패: ${e.message}`);
+    } finally {
+      setImportingResume(false);
+    }
+  };
+  const removeImportItem = (key, index) => {
+    setResumeImport({ ...resumeImport, [key]: resumeImport[key].filter((_, i) => i !== index) });
+  };
+  const saveResumeImport = async () => {
+    setImportingResume(true);
+    try {
+      await post("/profile/import", resumeImport);
+      setResumeImport(null);
+      await loadAll();
+      window.alert("이력서 항목을 저장했습니다.");
+    } catch (e) {
+      window.alert(`저장 실패: ${e.message}`);
+    } finally {
+      setImportingResume(false);
+    }
+  };
+
   // 평판 생성
   const createReputation = async (data) => {
     if (!data.target_user_id) {
@@ -1031,6 +1081,42 @@ export default function Profile({ initialSection: _initialSection, onLoaded, loa
         </Accordion>
       </div>
 
+      {/* 이력서 가져오기 */}
+      <div id="section-resume-import">
+        <Accordion title="이력서에서 가져오기" openByDefault={false}>
+          <div style={{ ...styles.mutedBox, marginBottom: 12 }}>
+            이력서(.txt, .docx, .pdf)를 올리면 경력·수상·자격증·프로젝트·강점 항목을 한 번에 추출합니다.
+            확인 후 저장하면 모든 항목이 한 번에 추가됩니다.
+          </div>
+          <input
+            type="file"
+            accept=".txt,.docx,.pdf"
+            disabled={importingResume}
+            onChange={(e) => { parseResume(e.target.files?.[0]); e.target.value = ""; }}
+          />
+          {importingResume && <div style={{ marginTop: 8, color: "#6b7280" }}>처리 중...</div>}
+          {resumeImport && (
+            <div style={{ marginTop: 16 }}>
+              {IMPORT_KINDS.map(({ key, label, title }) => (resumeImport[key] || []).length > 0 && (
+                <div key={key} style={{ marginBottom: 12 }}>
+                  <div style={{ fontWeight: 700, color: "#374151", marginBottom: 6 }}>{label} ({resumeImport[key].length})</div>
+                  {resumeImport[key].map((item, i) => (
+                    <div key={i} style={{ display: "flex", justifyContent: "space-between", alignItems: "center", padding: "6px 0", borderBottom: "1px solid #f3f4f6" }}>
+                      <span>{title(item)}</span>
+                      <button style={{ ...styles.button, ...styles.dangerBtn, padding: "4px 10px" }} onClick={() => removeImportItem(key, i)}>제외</button>
+                    </div>
+                  ))}
+                </div>
+              ))}
+              <div style={{ display: "flex", gap: 8 }}>
+                <button style={{ ...styles.button, ...styles.primaryBtn }} disabled={importingResume} onClick={saveResumeImport}>모두 저장</button>
+                <button style={{ ...styles.button }} disabled={importingResume} onClick={() => setResumeImport(null)}>취소</button>
+              </div>
+            </div>
+          )}
+        </Accordion>
+      </div>
+
       {/* 경력 */}
       <div id="section-experience">
         {renderList(
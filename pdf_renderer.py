@@ -0,0 +1,276 @@
+"""
+추천서 PDF 렌더러
+- 한글 폰트는 프로세스당 한 번만 등록 (PDF_FONT_PATH → 번들/시스템 폰트 → reportlab 내장 CID 폰트 순)
+- 줄바꿈은 글자별 폭 캐시 + 누적합 이분 탐색으로 처리 (글자마다 문자열 전체를 다시 재지 않음)
+- server.py와 분리되어 있어 렌더링 워커 프로세스에서도 가볍게 import 가능
+"""
+
+import os
+import io
+import re
+import base64
+import hashlib
+from bisect import bisect_right
+from collections import OrderedDict
+from itertools import accumulate
+from typing import Optional, List, Dict, Tuple
+
+from PIL import Image
+
+from reportlab.pdfgen import canvas
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 한글 TTF/TTC 후보 경로 (앞에서부터 시도)
+KOREAN_FONT_CANDIDATES = [
+    os.getenv("PDF_FONT_PATH", ""),
+    os.path.join(BASE_DIR, "fonts", "NanumGothic.ttf"),
+    "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
+    "/usr/share/fonts/nanum/NanumGothic.ttf",
+    "/usr/share/fonts/truetype/unfonts-core/UnDotum.ttf",
+    "C:/Windows/Fonts/malgun.ttf",
+    "C:/Windows/Fonts/gulim.ttc",
+    "/System/Library/Fonts/AppleGothic.ttf",
+]
+# 폰트 파일이 하나도 없을 때 사용하는 reportlab 내장 한글 CID 폰트
+KOREAN_CID_FONT = "HYSMyeongJo-Medium"
+
+TITLE_FONT_SIZE = 24
+BODY_FONT_SIZE = 11
+LINE_HEIGHT = 18
+MARGIN_X = 50
+
+CENTERED_PREFIXES = ('작성자:', '소속/직위:', '연락처:', '서명:')
+DATE_LINE_PATTERN = re.compile(r'^\d{4}년\s+\d{1,2}월\s+\d{1,2}일$')
+
+_registered_font: Optional[Tuple[str, bool]] = None
+# (폰트명, 크기) → {글자: 폭}
+_glyph_width_cache: Dict[Tuple[str, float], Dict[str, float]] = {}
+# 서명 콘텐츠 해시 → 디코딩된 ImageReader (프로세스별, 오래된 항목부터 제거)
+SIGNATURE_IMAGE_CACHE_MAX_ITEMS = 256
+_signature_image_cache: "OrderedDict[str, ImageReader]" = OrderedDict()
+
+
+def register_korean_font() -> Tuple[str, bool]:
+    """
+    한글 폰트를 한 번만 등록하고 (폰트명, 한글 지원 여부)를 반환
+    이후 호출은 캐시된 결과를 그대로 반환합니다.
+    """
+    global _registered_font
+    if _registered_font is not None:
+        return _registered_font
+
+    for path in KOREAN_FONT_CANDIDATES:
+        if not path or not os.path.exists(path):
+            continue
+        try:
+            pdfmetrics.registerFont(TTFont('Korean', path))
+            print(f"✅ PDF 한글 폰트 등록: {path}")
+            _registered_font = ('Korean', True)
+            return _registered_font
+        except Exception as e:
+            print(f"⚠️ PDF 폰트 등록 실패 ({path}): {e}")
+
+    try:
+        pdfmetrics.registerFont(UnicodeCIDFont(KOREAN_CID_FONT))
+        print(f"✅ PDF 한글 폰트 등록: 내장 CID 폰트 {KOREAN_CID_FONT}")
+        _registered_font = (KOREAN_CID_FONT, True)
+    except Exception as e:
+        print(f"⚠️ 한글 폰트를 등록하지 못했습니다. Helvetica 사용: {e}")
+        _registered_font = ('Helvetica', False)
+    return _registered_font
+
+
+def _glyph_widths(text: str, font_name: str, font_size: float) -> List[float]:
+    """글자별 폭 (폰트/크기별 캐시 사용)"""
+    cache = _glyph_width_cache.setdefault((font_name, font_size), {})
+    widths = []
+    for char in text:
+        width = cache.get(char)
+        if width is None:
+            width = cache[char] = pdfmetrics.stringWidth(char, font_name, font_size)
+        widths.append(width)
+    return widths
+
+
+def wrap_line(text: str, font_name: str, font_size: float, max_width: float) -> List[str]:
+    """
+    한 줄을 max_width 이내의 조각으로 나눔
+    글자 폭 누적합에서 이분 탐색으로 끊을 위치를 찾으므로 줄당 O(n log n)
+    """
+    if not text:
+        return []
+    prefix = list(accumulate(_glyph_widths(text, font_name, font_size), initial=0.0))
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = bisect_right(prefix, prefix[start] + max_width, lo=start + 1) - 1
+        if end <= start:
+            end = start + 1  # 한 글자가 max_width보다 넓어도 최소 한 글자는 출력
+        chunks.append(text[start:end])
+        start = end
+    return chunks
+
+
+def text_width(text: str, font_name: str, font_size: float) -> float:
+    """캐시된 글자 폭으로 문자열 폭 계산"""
+    return sum(_glyph_widths(text, font_name, font_size))
+
+
+def _signature_image(signature_data: dict) -> ImageReader:
+    """
+    서명 이미지를 ImageReader로 변환 (콘텐츠 해시 기준 캐시)
+    signatureAssets에서 온 서명은 hash가 있고, 레거시 서명은 data로 해시를 계산
+    """
+    sig_data = signature_data.get('data', '')
+    key = signature_data.get('hash') or hashlib.sha256(sig_data.encode('utf-8')).hexdigest()
+    reader = _signature_image_cache.get(key)
+    if reader is not None:
+        _signature_image_cache.move_to_end(key)
+        return reader
+
+    # data:image/png;base64, 접두사 제거 후 디코딩
+    if ',' in sig_data:
+        sig_data = sig_data.split(',', 1)[1]
+    with Image.open(io.BytesIO(base64.b64decode(sig_data))) as img:
+        # 팔레트/흑백 PNG도 투명도가 유지되도록 RGBA로 통일
+        reader = ImageReader(img.convert("RGBA"))
+
+    _signature_image_cache[key] = reader
+    while len(_signature_image_cache) > SIGNATURE_IMAGE_CACHE_MAX_ITEMS:
+        _signature_image_cache.popitem(last=False)
+    return reader
+
+
+def render_recommendation_pdf(content: str, signature_data: Optional[dict] = None) -> bytes:
+    """
+    추천서 본문과 서명 정보로 PDF 바이트 생성
+
+    Args:
+        content: 추천서 텍스트
+        signature_data: {"type": "draw"|"image"|"upload"|"text", "data": ..., "hash": ...} (선택)
+
+    Returns:
+        bytes: PDF 파일 내용
+    """
+    font_name, korean_font = register_korean_font()
+
+    buffer = io.BytesIO()
+    c = canvas.Canvas(buffer, pagesize=A4)
+    width, height = A4
+
+    # 제목 (보라색)
+    c.setFont(font_name if korean_font else 'Helvetica-Bold', TITLE_FONT_SIZE)
+    c.setFillColorRGB(0.58, 0.44, 0.86)  # #9370DB
+    c.drawCentredString(width / 2, height - 80, "추천서" if korean_font else "Recommendation Letter")
+
+    # 제목 아래 보라+노랑 선
+    y_line = height - 95
+    c.setStrokeColorRGB(0.58, 0.44, 0.86)  # #9370DB
+    c.setLineWidth(2)
+    c.line(100, y_line, width - 100, y_line)
+    c.setStrokeColorRGB(1.0, 0.84, 0.0)  # #FFD700
+    c.setLineWidth(1)
+    c.line(100, y_line - 3, width - 100, y_line - 3)
+
+    # 본문
+    c.setFillColorRGB(0, 0, 0)
+    c.setFont(font_name, BODY_FONT_SIZE)
+
+    y_position = height - 160
+    max_width = width - 100
+    signature_space = 120 if signature_data else 0  # 서명 공간 확보
+    page_bottom = 50 + signature_space
+    signature_y_position = None  # 서명 줄의 y 위치
+    signature_line_text = None  # 서명 줄의 텍스트
+
+    for line in (content or "").split('\n'):
+        line_stripped = line.strip()
+
+        # 빈 줄 처리
+        if not line_stripped:
+            y_position -= LINE_HEIGHT / 2
+            continue
+
+        # 가운데 정렬이 필요한 줄 (제목, 날짜, 작성자 정보)
+        is_centered = (
+            line_stripped.startswith(CENTERED_PREFIXES) or
+            line_stripped == '추천서' or
+            bool(DATE_LINE_PATTERN.match(line_stripped))
+        )
+        is_signature_line = line_stripped.startswith('서명:')
+        if is_signature_line:
+            signature_y_position = y_position
+            signature_line_text = line_stripped
+
+        chunks = wrap_line(line_stripped, font_name, BODY_FONT_SIZE, max_width)
+        for n, chunk in enumerate(chunks):
+            if is_centered:
+                c.drawCentredString(width / 2, y_position, chunk)
+            else:
+                c.drawString(MARGIN_X, y_position, chunk)
+            y_position -= LINE_HEIGHT
+            if n < len(chunks) - 1 and y_position < page_bottom:
+                c.showPage()
+                c.setFont(font_name, BODY_FONT_SIZE)
+                y_position = height - 50
+
+        # 서명: 줄 다음 여백
+        if signature_data and is_signature_line:
+            y_position -= 10
+
+        # 페이지 넘김
+        if y_position < page_bottom:
+            c.showPage()
+            c.setFont(font_name, BODY_FONT_SIZE)
+            y_position = height - 50
+
+    # "서명:" 라벨 바로 오른쪽 x 위치
+    sig_label_x = None
+    if signature_y_position is not None and signature_line_text is not None:
+        line_width = text_width(signature_line_text, font_name, BODY_FONT_SIZE)
+        label_width = text_width("서명: ", font_name, BODY_FONT_SIZE)
+        sig_label_x = (width / 2) - (line_width / 2) + label_width + 5
+
+    sig_type = signature_data.get('type') if signature_data else None
+    if sig_type in ('draw', 'image', 'upload'):
+        try:
+            img = _signature_image(signature_data)
+
+            sig_width = 120
+            sig_height = 50
+            if sig_label_x is not None:
+                sig_x = sig_label_x
+                sig_y = signature_y_position - sig_height / 2  # 텍스트와 수직 중앙 정렬
+            else:
+                # 서명 줄을 찾지 못한 경우 가운데
+                sig_x = (width - sig_width) / 2
+                sig_y = y_position - sig_height - 10
+
+            # 공간이 부족하면 새 페이지
+            if sig_y < 50:
+                c.showPage()
+                c.setFont(font_name, BODY_FONT_SIZE)
+                sig_y = height - sig_height - 100
+
+            c.drawImage(img, sig_x, sig_y, width=sig_width, height=sig_height, preserveAspectRatio=True, mask='auto')
+        except Exception as e:
+            print(f"서명 이미지 추가 오류: {e}")
+    elif sig_type == 'text':
+        try:
+            sig_text = signature_data.get('data', '')
+            c.setFont(font_name, 14)
+            if sig_label_x is not None:
+                c.drawString(sig_label_x, signature_y_position, sig_text)
+            else:
+                c.drawString(width - 200, y_position - 40, sig_text)
+        except Exception as e:
+            print(f"텍스트 서명 추가 오류: {e}")
+
+    c.save()
+    return buffer.getvalue()
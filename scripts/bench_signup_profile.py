@@ -0,0 +1,96 @@
+"""
+/signup/profile 지연 시간 벤치마크
+
+항목이 많은 프로필(기본 60개)을 반복 저장하며 p50/p95/평균 지연을 측정합니다.
+변경 전/후 서버에서 각각 실행해 비교합니다.
+
+사용법:
+    uvicorn server:app --port 8000                      # 측정할 버전의 서버 실행
+    python scripts/bench_signup_profile.py --items 60 --runs 20
+    python scripts/bench_signup_profile.py --user-id 123 # 기존 사용자 사용
+
+--user-id가 없으면 /signup/step1로 벤치마크 전용 사용자를 만듭니다.
+저장된 항목은 지워지지 않으므로 개발 DB에서만 실행하세요.
+"""
+
+import time
+import uuid
+import argparse
+import statistics
+
+import requests
+
+
+def build_profile(user_id: int, items: int) -> dict:
+    """items개를 5개 항목 종류에 고르게 분배한 프로필"""
+    per_kind = max(1, items // 5)
+    return {
+        "userId": user_id,
+        "experiences": [
+            {"company": f"회사 {i}", "position": "개발자", "startDate": "2020-01-01", "endDate": "2021-01-01",
+             "description": "백엔드 API 개발 및 운영"}
+            for i in range(per_kind)
+        ],
+        "awards": [
+            {"title": f"수상 {i}", "organization": "기관", "awardDate": "2022-05-01", "description": "우수상"}
+            for i in range(per_kind)
+        ],
+        "certifications": [
+            {"name": f"자격증 {i}", "issuer": "발급처", "issueDate": "2019-03-01", "certificationNumber": f"C-{i}"}
+            for i in range(per_kind)
+        ],
+        "projects": [
+            {"title": f"프로젝트 {i}", "role": "리드", "startDate": "2021-01-01", "endDate": "2021-06-01",
+             "description": "추천서 생성 서비스", "technologies": "Python, FastAPI", "achievement": "응답 시간 50% 단축"}
+            for i in range(per_kind)
+        ],
+        "strengths": [
+            {"category": "기술", "strength": f"강점 {i}", "description": "문제 해결"}
+            for i in range(items - per_kind * 4)
+        ],
+    }
+
+
+def create_bench_user(base_url: str) -> int:
+    email = f"bench-{uuid.uuid4().hex[:12]}@example.com"
+    res = requests.post(f"{base_url}/signup/step1", json={
+        "name": "벤치마크",
+        "email": email,
+        "password": "bench-password",
+        "password_confirm": "bench-password",
+    }, timeout=30)
+    res.raise_for_status()
+    return res.json()["userId"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/signup/profile 지연 시간 벤치마크")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--user-id", type=int, default=None)
+    parser.add_argument("--items", type=int, default=60, help="요청당 프로필 항목 수")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    args = parser.parse_args()
+
+    user_id = args.user_id or create_bench_user(args.base_url)
+    payload = build_profile(user_id, args.items)
+    session = requests.Session()
+
+    latencies = []
+    for i in range(args.warmup + args.runs):
+        started = time.perf_counter()
+        res = session.post(f"{args.base_url}/signup/profile", json=payload, timeout=60)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        res.raise_for_status()
+        if i >= args.warmup:
+            latencies.append(elapsed_ms)
+
+    latencies.sort()
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    print(f"user_id={user_id} items={args.items} runs={args.runs}")
+    print(f"p50={statistics.median(latencies):.1f}ms p95={p95:.1f}ms "
+          f"mean={statistics.mean(latencies):.1f}ms min={latencies[0]:.1f}ms max={latencies[-1]:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+"""
+주요 조회 쿼리 실행 계획(EXPLAIN) 벤치마크
+
+인덱스 마이그레이션(20261021-add-composite-list-indexes) 적용 전/후 계획을 저장해 비교합니다.
+OR 조건을 쓰던 기존 쿼리(legacy_*)도 함께 측정해 UNION ALL 재작성 효과를 확인할 수 있습니다.
+
+사용법:
+    python scripts/explain_hot_queries.py --output before.json            # 마이그레이션 전
+    npx sequelize-cli db:migrate                                          # (db/ 디렉터리에서)
+    python scripts/explain_hot_queries.py --output after.json             # 마이그레이션 후
+    python scripts/explain_hot_queries.py --compare before.json after.json
+
+    --analyze: 실제 실행 시간까지 측정 (EXPLAIN ANALYZE, 쿼리가 실제로 실행됨)
+"""
+
+import os
+import sys
+import json
+import argparse
+from pathlib import Path
+
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, text as sql_text
+
+load_dotenv(Path(__file__).resolve().parent.parent / ".env")
+
+PAGE_LIMIT = 21  # 목록 API: limit + 1
+EXCERPT_LEN = 121
+
+# (이름, SQL) - server.py의 실제 쿼리와 같은 형태
+HOT_QUERIES = [
+    ("my_recommendations_sent", """
+        SELECT r.id, SUBSTRING(r.content, 1, :excerpt_len) AS excerpt, r.createdAt, u_to.nickname AS to_name
+        FROM recommendation r
+        JOIN users u_to ON u_to.id = r.toUserId
+        WHERE r.deletedAt IS NULL AND r.fromUserId = :user_id
+        ORDER BY r.createdAt DESC, r.id DESC
+        LIMIT :limit
+    """),
+    ("history_all", """
+        SELECT rl.id, SUBSTRING(rl.content, 1, :excerpt_len) AS excerpt, rl.createdAt
+        FROM recommendation rl
+        WHERE rl.deletedAt IS NULL
+        ORDER BY rl.createdAt DESC, rl.id DESC
+        LIMIT :limit
+    """),
+    ("legacy_reference_history_or", """
+        SELECT rl.id, rl.createdAt
+        FROM recommendation rl
+        WHERE (rl.fromUserId = :user_id OR rl.toUserId = :user_id)
+          AND rl.deletedAt IS NULL
+        ORDER BY rl.createdAt DESC, rl.id DESC
+        LIMIT :limit
+    """),
+    ("reference_history_union_all", """
+        SELECT rl.id, rl.createdAt
+        FROM (
+            (SELECT r.id, r.createdAt FROM recommendation r
+             WHERE r.fromUserId = :user_id AND r.deletedAt IS NULL
+             ORDER BY r.createdAt DESC, r.id DESC LIMIT :limit)
+            UNION ALL
+            (SELECT r.id, r.createdAt FROM recommendation r
+             WHERE r.toUserId = :user_id AND r.fromUserId <> :user_id AND r.deletedAt IS NULL
+             ORDER BY r.createdAt DESC, r.id DESC LIMIT :limit)
+        ) rl
+        ORDER BY rl.createdAt DESC, rl.id DESC
+        LIMIT :limit
+    """),
+    ("legacy_lookup_count_or", """
+        SELECT COUNT(DISTINCT rl.id) AS total_count
+        FROM recommendation rl
+        WHERE (rl.fromUserId = :user_id OR rl.toUserId = :user_id)
+          AND rl.deletedAt IS NULL
+    """),
+    ("lookup_count_union_all", """
+        SELECT COUNT(*) AS total_count
+        FROM (
+            SELECT id FROM recommendation WHERE fromUserId = :user_id AND deletedAt IS NULL
+            UNION ALL
+            SELECT id FROM recommendation WHERE toUserId = :user_id AND fromUserId <> :user_id AND deletedAt IS NULL
+        ) rl
+    """),
+    ("lookup_count_counters", """
+        SELECT COALESCE(uc.sentRecommendations, 0) + COALESCE(uc.receivedRecommendations, 0) AS total_count
+        FROM users u
+        LEFT JOIN userCounters uc ON uc.userId = u.id
+        WHERE u.id = :user_id
+    """),
+    ("my_reputations_sent", """
+        SELECT r.id, r.rating, r.createdAt
+        FROM userReputations r
+        WHERE r.deletedAt IS NULL AND r.fromUserId = :user_id
+        ORDER BY r.createdAt DESC, r.id DESC
+        LIMIT :limit
+    """),
+    ("profile_experiences", """
+        SELECT id, company, position, startDate, endDate
+        FROM userExperiences
+        WHERE userId = :user_id AND deletedAt IS NULL
+        ORDER BY startDate DESC
+    """),
+    ("profile_strengths", """
+        SELECT id, category, strength
+        FROM userStrengths
+        WHERE userId = :user_id AND deletedAt IS NULL
+        ORDER BY category, id
+    """),
+    ("generate_from_user_by_nickname", """
+        SELECT id, email FROM users
+        WHERE deletedAt IS NULL AND nickname = :nickname
+        LIMIT 1
+    """),
+    ("search_company_by_name", """
+        SELECT id, name FROM workspaces
+        WHERE deletedAt IS NULL AND name = :company_name
+        LIMIT 1
+    """),
+    ("templates", """
+        SELECT id, title, description, createdAt
+        FROM recommendationTemplates
+        WHERE deletedAt IS NULL
+        ORDER BY createdAt DESC
+    """),
+]
+
+
+def pick_heavy_user(conn) -> int:
+    """추천서를 가장 많이 작성한 사용자 (계획 차이가 가장 잘 드러나는 대상)"""
+    row = conn.execute(sql_text("""
+        SELECT fromUserId AS user_id FROM recommendation
+        WHERE deletedAt IS NULL
+        GROUP BY fromUserId
+        ORDER BY COUNT(*) DESC
+        LIMIT 1
+    """)).first()
+    return row._mapping.get("user_id") if row else 1
+
+
+def pick_lookup_keys(conn, user_id: int) -> dict:
+    """이름 조회 쿼리용 샘플 값 (해당 사용자 닉네임, 임의의 회사명)"""
+    nickname = conn.execute(sql_text("SELECT nickname FROM users WHERE id = :uid"), {"uid": user_id}).scalar()
+    company_name = conn.execute(sql_text("SELECT name FROM workspaces WHERE deletedAt IS NULL LIMIT 1")).scalar()
+    return {"nickname": nickname or "", "company_name": company_name or ""}
+
+
+def explain(conn, dialect: str, query: str, params: dict, analyze: bool):
+    """EXPLAIN 결과를 (요약, 원본) 형태로 반환"""
+    if dialect == "postgresql":
+        prefix = "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " if analyze else "EXPLAIN (FORMAT JSON) "
+        raw = conn.execute(sql_text(prefix + query), params).scalar()
+        plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]
+        return summarize_postgres(plan), plan
+
+    raw = conn.execute(sql_text("EXPLAIN FORMAT=JSON " + query), params).scalar()
+    plan = json.loads(raw)
+    summary = summarize_mysql(plan)
+    if analyze:
+        # MySQL 8.0.18+: 트리 형식의 실제 실행 정보
+        summary["analyze"] = conn.execute(sql_text("EXPLAIN ANALYZE " + query), params).scalar()
+    return summary, plan
+
+
+def summarize_postgres(plan: dict) -> dict:
+    nodes = []
+
+    def walk(node):
+        nodes.append(node)
+        for child in node.get("Plans", []):
+            walk(child)
+
+    walk(plan["Plan"])
+    return {
+        "cost": plan["Plan"].get("Total Cost"),
+        "time_ms": plan.get("Execution Time"),
+        "full_scans": sorted({n["Relation Name"] for n in nodes if n.get("Node Type") == "Seq Scan"}),
+        "indexes": sorted({n["Index Name"] for n in nodes if n.get("Index Name")}),
+        "sorts": sum(1 for n in nodes if n.get("Node Type") in ("Sort", "Incremental Sort")),
+    }
+
+
+def summarize_mysql(plan: dict) -> dict:
+    tables = []
+
+    def walk(value):
+        if isinstance(value, dict):
+            if "table_name" in value and "access_type" in value:
+                tables.append(value)
+            for child in value.values():
+                walk(child)
+        elif isinstance(value, list):
+            for child in value:
+                walk(child)
+
+    walk(plan)
+    query_block = plan.get("query_block", {})
+    plan_text = json.dumps(plan)
+    return {
+        "cost": float(query_block.get("cost_info", {}).get("query_cost", 0) or 0),
+        "time_ms": None,
+        "full_scans": sorted({t["table_name"] for t in tables if t.get("access_type") == "ALL"}),
+        "indexes": sorted({t["key"] for t in tables if t.get("key")}),
+        "sorts": plan_text.count('"using_filesort": true'),
+    }
+
+
+def run(output: str, analyze: bool):
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        sys.exit("DATABASE_URL 환경변수가 필요합니다.")
+    if database_url.startswith("postgresql://"):
+        # requirements.txt의 psycopg(3) 드라이버 사용 (드라이버가 명시된 URL은 그대로)
+        database_url = database_url.replace("postgresql://", "postgresql+psycopg://", 1)
+
+    engine = create_engine(database_url)
+    dialect = engine.dialect.name
+    results = {"dialect": dialect, "queries": {}}
+    with engine.connect() as conn:
+        user_id = pick_heavy_user(conn)
+        params = {"user_id": user_id, "limit": PAGE_LIMIT, "excerpt_len": EXCERPT_LEN, **pick_lookup_keys(conn, user_id)}
+        results["user_id"] = user_id
+        for name, query in HOT_QUERIES:
+            try:
+                # 실패해도 다음 쿼리는 계속 (Postgres는 오류 시 트랜잭션이 중단되므로 savepoint로 감쌈)
+                with conn.begin_nested():
+                    summary, plan = explain(conn, dialect, query, params, analyze)
+            except Exception as e:
+                # 예: 마이그레이션 전에는 userCounters 테이블이 없음
+                results["queries"][name] = {"error": str(e).splitlines()[0]}
+                print(f"{name:32s} 건너뜀: {results['queries'][name]['error']}")
+                continue
+            results["queries"][name] = {"summary": summary, "plan": plan}
+            print(f"{name:32s} cost={summary['cost']!s:>10s} time_ms={summary['time_ms']!s:>8s} "
+                  f"full_scans={summary['full_scans']} indexes={summary['indexes']} sorts={summary['sorts']}")
+        # EXPLAIN ANALYZE가 실제로 실행한 쿼리 영향 방지
+        conn.rollback()
+
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2, default=str)
+    print(f"\n저장: {output} (dialect={dialect}, user_id={user_id})")
+
+
+def _result_status(result: dict) -> str:
+    if "summary" in result:
+        return "ok"
+    return "실패" if "error" in result else "없음"
+
+
+def compare(before_path: str, after_path: str):
+    with open(before_path, encoding="utf-8") as f:
+        before = json.load(f)["queries"]
+    with open(after_path, encoding="utf-8") as f:
+        after = json.load(f)["queries"]
+
+    print(f"{'query':32s} {'cost before':>12s} {'cost after':>12s}  full scans (before → after)")
+    names = list(before) + [name for name in after if name not in before]
+    for name in names:
+        b, a = before.get(name, {}), after.get(name, {})
+        if "summary" not in b or "summary" not in a:
+            # 한쪽에만 있거나 실행 실패한 쿼리 (예: 마이그레이션 전 userCounters 없음)
+            print(f"{name:32s} 비교 불가 ({_result_status(b)} → {_result_status(a)})")
+            continue
+        b, a = b["summary"], a["summary"]
+        print(f"{name:32s} {b['cost']!s:>12s} {a['cost']!s:>12s}  {b['full_scans']} → {a['full_scans']}")
+        if b.get("time_ms") is not None and a.get("time_ms") is not None:
+            print(f"{'':32s} time_ms {b['time_ms']} → {a['time_ms']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="주요 조회 쿼리 EXPLAIN 벤치마크")
+    parser.add_argument("--output", default="explain_plans.json", help="계획 저장 파일")
+    parser.add_argument("--analyze", action="store_true", help="EXPLAIN ANALYZE로 실제 실행 시간 측정")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="저장된 두 결과 비교")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+    else:
+        run(args.output, args.analyze)
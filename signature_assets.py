@@ -0,0 +1,99 @@
+"""
+서명 이미지 정규화
+- 업로드/그린 서명(base64 data URL)을 한 번만 디코딩해 여백 제거(trim) → 축소 → PNG 재인코딩
+- 정규화된 바이트의 SHA-256을 콘텐츠 해시로 사용 (signatureAssets.contentHash)
+- server.py와 분리되어 있어 렌더링 워커 프로세스에서도 가볍게 import 가능
+"""
+
+import io
+import base64
+import hashlib
+from typing import Tuple
+
+from PIL import Image, ImageChops
+
+# 서명으로 취급하는 이미지 타입 (text 서명은 정규화 대상 아님)
+IMAGE_SIGNATURE_TYPES = ("draw", "image", "upload")
+
+SIGNATURE_MAX_WIDTH = 600
+SIGNATURE_MAX_HEIGHT = 250
+SIGNATURE_MAX_UPLOAD_BYTES = 5 * 1024 * 1024
+SIGNATURE_MAX_PIXELS = 25_000_000  # 압축 폭탄 방지
+TRIM_PADDING = 4
+SIGNATURE_PALETTE_COLORS = 64
+# 이 밝기 이상은 배경(흰 종이)으로 보고 잘라냄
+BACKGROUND_LUMINANCE = 245
+
+
+def decode_data_url(data: str) -> bytes:
+    """data:image/png;base64,... 또는 순수 base64 문자열을 바이트로 디코딩"""
+    if not data:
+        raise ValueError("서명 데이터가 비어 있습니다.")
+    if ',' in data:
+        data = data.split(',', 1)[1]
+    try:
+        raw = base64.b64decode(data, validate=False)
+    except Exception as e:
+        raise ValueError(f"서명 데이터를 디코딩할 수 없습니다: {e}")
+    if len(raw) > SIGNATURE_MAX_UPLOAD_BYTES:
+        raise ValueError("서명 이미지가 너무 큽니다.")
+    return raw
+
+
+def to_data_url(image_bytes: bytes, mime_type: str = "image/png") -> str:
+    """이미지 바이트를 data URL로 변환 (프론트엔드 응답용)"""
+    return f"data:{mime_type};base64," + base64.b64encode(image_bytes).decode("ascii")
+
+
+def content_hash(png_bytes: bytes) -> str:
+    """정규화된 이미지의 콘텐츠 해시"""
+    return hashlib.sha256(png_bytes).hexdigest()
+
+
+def normalize_signature_image(raw: bytes) -> Tuple[bytes, int, int]:
+    """
+    서명 이미지를 정규화
+
+    Returns:
+        (PNG 바이트, 너비, 높이)
+    """
+    try:
+        with Image.open(io.BytesIO(raw)) as img:
+            if img.width * img.height > SIGNATURE_MAX_PIXELS:
+                raise ValueError("서명 이미지 해상도가 너무 큽니다.")
+            img = img.convert("RGBA")
+    except ValueError:
+        raise
+    except Exception as e:
+        raise ValueError(f"서명 이미지를 읽을 수 없습니다: {e}")
+
+    # 잉크 영역 = 불투명하면서 배경보다 어두운 픽셀
+    ink = img.convert("L").point(lambda v: 255 if v < BACKGROUND_LUMINANCE else 0)
+    mask = ImageChops.multiply(img.getchannel("A"), ink)
+    bbox = mask.getbbox()
+    if bbox:
+        left, top, right, bottom = bbox
+        img = img.crop((
+            max(0, left - TRIM_PADDING),
+            max(0, top - TRIM_PADDING),
+            min(img.width, right + TRIM_PADDING),
+            min(img.height, bottom + TRIM_PADDING),
+        ))
+
+    img.thumbnail((SIGNATURE_MAX_WIDTH, SIGNATURE_MAX_HEIGHT), Image.LANCZOS)
+
+    # 서명은 색이 적으므로 팔레트 PNG로 줄임 (투명도 유지)
+    out = io.BytesIO()
+    img.quantize(colors=SIGNATURE_PALETTE_COLORS, method=Image.Quantize.FASTOCTREE).save(out, format="PNG", optimize=True)
+    return out.getvalue(), img.width, img.height
+
+
+def normalize_signature_data_url(data: str) -> Tuple[bytes, str, int, int]:
+    """
+    data URL 서명을 정규화하고 해시 계산
+
+    Returns:
+        (PNG 바이트, 콘텐츠 해시, 너비, 높이)
+    """
+    png_bytes, width, height = normalize_signature_image(decode_data_url(data))
+    return png_bytes, content_hash(png_bytes), width, height